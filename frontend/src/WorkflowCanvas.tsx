@@ -260,6 +260,7 @@ export default function WorkflowCanvas() {
 
   // ---- Modal states ----
   const [pluginManagerVisible, setPluginManagerVisible] = useState(false);
+  const [pluginsVersion, setPluginsVersion] = useState(0);
   const [helpVisible, setHelpVisible] = useState(false);
 
   // ---- Health data ----
@@ -384,6 +385,33 @@ export default function WorkflowCanvas() {
       ]);
     });
 
+    wsOn('log_batch', (data) => {
+      const entries = (data.entries as Record<string, unknown>[]) ?? [];
+      setLogs((prev) => [
+        ...prev,
+        ...entries.map((entry) => ({
+          timestamp: (entry.timestamp as number) || Date.now() / 1000,
+          level: entry.level as string,
+          node_id: entry.node_id as string,
+          node_type: entry.node_type as string,
+          message: entry.message as string,
+          event: 'log',
+        })),
+      ]);
+    });
+
+    wsOn('lagged', (data) => {
+      setLogs((prev) => [
+        ...prev,
+        {
+          timestamp: Date.now() / 1000,
+          level: 'WARN',
+          message: `${data.dropped as number} log events dropped (server buffer full)`,
+          event: 'lagged',
+        },
+      ]);
+    });
+
     wsOn('complete', (data) => {
       const totalMs = data.total_ms as number;
       setLogs((prev) => [
@@ -396,7 +424,34 @@ export default function WorkflowCanvas() {
         },
       ]);
     });
-  }, [wsOn, setNodes]);
+
+    wsOn('plugin_installed', async (data) => {
+      setLogs((prev) => [
+        ...prev,
+        {
+          timestamp: Date.now() / 1000,
+          level: 'SYSTEM',
+          message: `Plugin '${data.name}' installed`,
+          event: 'plugin_installed',
+        },
+      ]);
+      await refetchRegistry();
+      await checkNodeStates();
+      setPluginsVersion((v) => v + 1);
+    });
+
+    wsOn('plugin_error', (data) => {
+      setLogs((prev) => [
+        ...prev,
+        {
+          timestamp: Date.now() / 1000,
+          level: 'ERROR',
+          message: `Plugin '${data.name}' failed to install: ${data.message}`,
+          event: 'plugin_error',
+        },
+      ]);
+    });
+  }, [wsOn, setNodes, refetchRegistry, checkNodeStates]);
 
   // ---- Snapshot helper: push current state for undo ----
 
@@ -860,7 +915,11 @@ export default function WorkflowCanvas() {
 
       if (!response.ok) {
         const err = await response.json().catch(() => ({ detail: response.statusText }));
-        throw new Error(err.detail ?? `HTTP ${response.status}`);
+        // 422 (malformed node/edge) carries a list of validation errors
+        const detail = Array.isArray(err.detail)
+          ? err.detail.map((d: { msg?: string }) => d.msg).join('; ')
+          : err.detail;
+        throw new Error(detail ?? `HTTP ${response.status}`);
       }
 
       const results = await response.json();
@@ -1407,6 +1466,7 @@ export default function WorkflowCanvas() {
         visible={pluginManagerVisible}
         onClose={() => setPluginManagerVisible(false)}
         onReload={async () => { await refetchRegistry(); await checkNodeStates(); }}
+        refreshKey={pluginsVersion}
       />
 
       {/* Help Modal */}
@@ -10,9 +10,11 @@ export interface PluginManagerProps {
   visible: boolean;
   onClose: () => void;
   onReload?: () => void;
+  /** Bumped when the server reports a background plugin install finished */
+  refreshKey?: number;
 }
 
-export function PluginManager({ visible, onClose, onReload }: PluginManagerProps) {
+export function PluginManager({ visible, onClose, onReload, refreshKey }: PluginManagerProps) {
   const [projects, setProjects] = useState<ProjectInfo[]>([]);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
@@ -45,6 +47,11 @@ export function PluginManager({ visible, onClose, onReload }: PluginManagerProps
     }
   }, [visible, fetchPlugins]);
 
+  // Installs finish in the background; refresh the list when one lands
+  useEffect(() => {
+    if (visible && refreshKey) fetchPlugins();
+  }, [refreshKey]); // eslint-disable-line react-hooks/exhaustive-deps
+
   // Close on Escape
   useEffect(() => {
     if (!visible) return;
@@ -101,9 +108,9 @@ export function PluginManager({ visible, onClose, onReload }: PluginManagerProps
       });
       const data = await res.json();
       if (!res.ok) throw new Error(data.detail || `HTTP ${res.status}`);
-      setSuccessMsg(data.message || `Plugin '${data.name}' installed.`);
-      await fetchPlugins();
-      onReload?.();
+      // Accepted (202): extraction and reload finish server-side, then a
+      // plugin_installed WS event triggers the refresh
+      setSuccessMsg(data.message || `Plugin '${data.name}' is being installed.`);
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Install failed');
     } finally {
@@ -36,17 +36,26 @@ export function useWebSocket(url: string) {
       ws.close();
     };
 
+    const dispatch = (data: WsEvent) => {
+      const handlers = handlersRef.current.get(data.event);
+      if (handlers) {
+        for (const h of handlers) h(data);
+      }
+      // Also call wildcard handlers if present
+      const wildcards = handlersRef.current.get('*');
+      if (wildcards) {
+        for (const h of wildcards) h(data);
+      }
+    };
+
     ws.onmessage = (msg) => {
       try {
         const data = JSON.parse(msg.data) as WsEvent;
-        const handlers = handlersRef.current.get(data.event);
-        if (handlers) {
-          for (const h of handlers) h(data);
-        }
-        // Also call wildcard handlers if present
-        const wildcards = handlersRef.current.get('*');
-        if (wildcards) {
-          for (const h of wildcards) h(data);
+        // The server coalesces an execution's events into "batch" frames
+        if (data.event === 'batch') {
+          for (const item of data.items as WsEvent[]) dispatch(item);
+        } else {
+          dispatch(data);
         }
       } catch (err) {
         console.warn('[WS] Failed to parse message:', err);
@@ -5,9 +5,17 @@ Supports three loop styles:
 - ComfyUI style (loop_start + loop_end pair)
 - n8n style (loop_node with back-edge feedback)
 """
+import contextvars
+import os
+import sys
+import threading
 import time
 import traceback
-from typing import Any, Callable, Dict, List, Optional, Set
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import numpy as np
 
@@ -17,12 +25,203 @@ from pipestudio.plugin_api import get_executors, logger as node_logger
 
 MAX_ITERATIONS = 10000
 
+# Log entries produced inside loop iterations are sent as "log_batch" events,
+# flushed every LOG_BATCH_SIZE entries or LOG_FLUSH_INTERVAL seconds.
+LOG_BATCH_SIZE = 64
+LOG_FLUSH_INTERVAL = 0.016
+
+# Worker threads for running independent loop body nodes concurrently
+DEFAULT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
 
 def _clamp_iterations(raw) -> int:
     """Clamp iterations to [1, MAX_ITERATIONS]."""
     return max(1, min(int(raw), MAX_ITERATIONS))
 
 
+# --- Breakpoint data summaries (exact-type dispatch, isinstance fallback) ---
+
+@lru_cache(maxsize=64)
+def _dtype_name(dtype: np.dtype) -> str:
+    return str(dtype)
+
+
+def _summarize_array(value: np.ndarray) -> Dict[str, Any]:
+    # Metadata only: never touches the array buffer, O(1) for any size
+    shape = value.shape
+    return {
+        "_type": "array",
+        "shape": shape,
+        "dtype": _dtype_name(value.dtype),
+        "length": shape[0] if shape else 1,
+    }
+
+
+def _summarize_scalar(value: Any) -> Any:
+    return value
+
+
+def _summarize_dict(value: dict) -> Dict[str, Any]:
+    if value.get("_type") == "array":
+        return value
+    return {"_type": type(value).__name__}
+
+
+def _summarize_list(value: Any) -> Dict[str, Any]:
+    try:
+        length = value.__len__()
+    except Exception:
+        # Subclasses may override __len__ with something unsafe; don't iterate
+        length = None
+    return {"_type": "list", "length": length}
+
+
+_SUMMARIZERS: Dict[type, Callable[[Any], Any]] = {
+    np.ndarray: _summarize_array,
+    int: _summarize_scalar,
+    float: _summarize_scalar,
+    str: _summarize_scalar,
+    bool: _summarize_scalar,
+    dict: _summarize_dict,
+    list: _summarize_list,
+    tuple: _summarize_list,
+}
+
+
+def _summarize_fallback(value: Any) -> Any:
+    """Summarize subclasses and other types not in _SUMMARIZERS."""
+    if isinstance(value, np.ndarray):
+        return _summarize_array(value)
+    if isinstance(value, dict) and value.get("_type") == "array":
+        return value
+    if isinstance(value, (int, float, str, bool)):
+        return value
+    if callable(value):
+        name = getattr(value, '__name__', type(value).__name__)
+        return {"_type": "function", "name": name}
+    if isinstance(value, (list, tuple)):
+        return _summarize_list(value)
+    return {"_type": type(value).__name__}
+
+
+def _unavailable_executor(node_id: str, node_type: str) -> Callable:
+    """Stand-in executor for a node whose plugin is inactive or missing."""
+    def executor(params, **inputs):
+        raise NodeUnavailableError(
+            node_id=node_id,
+            node_type=node_type,
+            reason="inactive or not installed",
+        )
+    return executor
+
+
+# --- Topological ordering (pure, cached across executions of the same graph) ---
+
+def _kahn_init(node_ids: FrozenSet[str], edges: Tuple[Tuple[str, str], ...]):
+    in_degree = {nid: 0 for nid in node_ids}
+    adj: Dict[str, List[str]] = {nid: [] for nid in node_ids}
+    for source, target in edges:
+        in_degree[target] += 1
+        adj[source].append(target)
+    return in_degree, adj
+
+
+@lru_cache(maxsize=32)
+def _topo_order(node_ids: FrozenSet[str], edges: Tuple[Tuple[str, str], ...]) -> Tuple[str, ...]:
+    """Kahn's algorithm over (source, target) pairs between node_ids."""
+    in_degree, adj = _kahn_init(node_ids, edges)
+    queue = deque(nid for nid, deg in in_degree.items() if deg == 0)
+    order = []
+    while queue:
+        nid = queue.popleft()
+        order.append(nid)
+        for neighbor in adj[nid]:
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                queue.append(neighbor)
+    return tuple(order)
+
+
+@lru_cache(maxsize=32)
+def _topo_levels(node_ids: FrozenSet[str],
+                 edges: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[str, ...], ...]:
+    """Kahn's algorithm grouped by level: nodes in a level do not depend on each other."""
+    in_degree, adj = _kahn_init(node_ids, edges)
+    levels = []
+    level = [nid for nid, deg in in_degree.items() if deg == 0]
+    while level:
+        levels.append(tuple(level))
+        next_level = []
+        for nid in level:
+            for neighbor in adj[nid]:
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    next_level.append(neighbor)
+        level = next_level
+    return tuple(levels)
+
+
+# An input source packed for the hot path: (source_id, source_port, target_port)
+InputSource = Tuple[str, str, str]
+
+
+def _pack_edges(node_id: str, edges: List[WorkflowEdge]) -> Tuple[InputSource, ...]:
+    """Pack a node's incoming forward edges into plain tuples."""
+    return tuple(
+        (e.source, e.source_port, e.target_port) for e in edges
+        if not e.is_back_edge and e.target == node_id  # Back-edges handled by loop executor
+    )
+
+
+def _gather_inputs(node_outputs: Dict[str, Dict[str, Any]],
+                   sources: Tuple[InputSource, ...]) -> Dict[str, Any]:
+    """Collect inputs from upstream outputs over packed sources.
+
+    If multiple sources target the same port, values are collected into a list.
+    Single-source ports receive the value directly (no wrapping).
+    """
+    inputs: Dict[str, Any] = {}
+    multi: Optional[Set[str]] = None  # ports that already hold a list of values
+    for source, source_port, port in sources:
+        source_outputs = node_outputs.get(source)
+        if source_outputs is None or source_port not in source_outputs:
+            continue
+        value = source_outputs[source_port]
+        if port not in inputs:
+            inputs[port] = value
+        elif multi is not None and port in multi:
+            inputs[port].append(value)
+        else:
+            if multi is None:
+                multi = set()
+            multi.add(port)
+            inputs[port] = [inputs[port], value]
+    return inputs
+
+
+_MISSING = object()
+
+
+def _same_inputs(previous: Dict[str, Any], current: Dict[str, Any]) -> bool:
+    """True if both input dicts hold the very same objects on the same ports."""
+    if len(previous) != len(current):
+        return False
+    for port, value in current.items():
+        if previous.get(port, _MISSING) is not value:
+            return False
+    return True
+
+
+def _pool_map(pool: ThreadPoolExecutor, fn: Callable[[str], Any], items: List[str]) -> List[Any]:
+    """pool.map, with each call run in its own copy of the caller's context.
+
+    Worker threads do not inherit ContextVars; copying keeps the calling
+    thread's context (e.g. NodeLogger state) visible to the node.
+    """
+    futures = [pool.submit(contextvars.copy_context().run, fn, item) for item in items]
+    return [future.result() for future in futures]
+
+
 class WorkflowExecutor:
     """Executes a workflow DAG with support for loops and event streaming."""
 
@@ -31,20 +230,62 @@ class WorkflowExecutor:
         workflow: WorkflowDefinition,
         event_handler: Optional[Callable] = None,
         breakpoints: Optional[set] = None,
+        verbose: bool = True,
+        max_workers: Optional[int] = None,
+        log_level: Optional[str] = None,
     ):
         self.workflow = workflow
         self.nodes_by_id: Dict[str, WorkflowNode] = {n.id: n for n in workflow.nodes}
+
+        # Edge indices, built once: the graph is read-only during execution.
+        # _in_edges/_out_edges only hold forward edges; back-edges are kept apart
+        # for the n8n loop feedback.
+        self._forward_edges: List[WorkflowEdge] = []
+        self._back_edges: List[WorkflowEdge] = []
+        self._in_edges: Dict[str, List[WorkflowEdge]] = {nid: [] for nid in self.nodes_by_id}
+        self._out_edges: Dict[str, List[WorkflowEdge]] = {nid: [] for nid in self.nodes_by_id}
+        for e in workflow.edges:
+            if e.is_back_edge:
+                self._back_edges.append(e)
+                continue
+            self._forward_edges.append(e)
+            self._in_edges.setdefault(e.target, []).append(e)
+            self._out_edges.setdefault(e.source, []).append(e)
+        self._forward_adj: Dict[str, List[str]] = {
+            nid: [e.target for e in out] for nid, out in self._out_edges.items()
+        }
+        self._children_by_parent: Dict[str, List[WorkflowNode]] = {}
+        for n in workflow.nodes:
+            if n.parent_id is not None:
+                self._children_by_parent.setdefault(n.parent_id, []).append(n)
+
+        self._loop_body_cache: Dict[Tuple[str, str], FrozenSet[str]] = {}
+
         self.node_outputs: Dict[str, Dict[str, Any]] = {}
         self.event_handler = event_handler
         self.breakpoints: set = breakpoints or set()
+        self.verbose = verbose
+        self.max_workers = DEFAULT_MAX_WORKERS if max_workers is None else max_workers
+        # Lowest plugin log level recorded; None keeps PIPESTUDIO_LOG_LEVEL
+        self.log_level = log_level
         self.executors = get_executors()
         self._log_entries: List[dict] = []
+        self._log_buffer: List[dict] = []
+        self._batching_logs = False
+        self._last_log_flush = 0.0
         self._node_timings: Dict[str, float] = {}
+        self._memo_hits: Dict[str, int] = {}  # pure loop body node -> reused results
+        self._seq = 0
+        # Loop body nodes may log from worker threads
+        self._event_lock = threading.RLock()
 
     def _emit(self, event_type: str, **data):
-        """Emit an event (for WebSocket streaming)."""
+        """Emit an event (for WebSocket streaming), tagged with a sequence number."""
         if self.event_handler:
-            self.event_handler(event_type, data)
+            with self._event_lock:
+                self._seq += 1
+                data["seq"] = self._seq
+                self.event_handler(event_type, data)
 
     def _log_handler(self, level: str, node_id: str, node_type: str, message: str):
         """Captures logs from plugin nodes via the logger singleton."""
@@ -55,56 +296,159 @@ class WorkflowExecutor:
             "message": message,
             "timestamp": time.time(),
         }
-        self._log_entries.append(entry)
-        self._emit("log", **entry)
-        print(f"  [{level}] [{node_type}:{node_id}] {message}")
+        with self._event_lock:
+            self._log_entries.append(entry)
+            if self._batching_logs:
+                self._log_buffer.append(entry)
+                if (len(self._log_buffer) >= LOG_BATCH_SIZE
+                        or entry["timestamp"] - self._last_log_flush >= LOG_FLUSH_INTERVAL):
+                    self._flush_logs()
+                return
+            self._emit("log", **entry)
+        if self.verbose:
+            print(f"  [{level}] [{node_type}:{node_id}] {message}")
+
+    def _flush_logs(self):
+        """Emit buffered log entries as a single "log_batch" event.
+
+        In verbose mode the batch is echoed to stdout with a single write.
+        """
+        if self._log_buffer:
+            self._emit("log_batch", entries=self._log_buffer)
+            if self.verbose:
+                sys.stdout.write("".join(
+                    f"  [{e['level']}] [{e['node_type']}:{e['node_id']}] {e['message']}\n"
+                    for e in self._log_buffer
+                ))
+            self._log_buffer = []
+        self._last_log_flush = time.time()
+
+    @contextmanager
+    def _batched_logs(self):
+        """Buffer log events for the duration of a loop, flushing on exit."""
+        outer = self._batching_logs
+        self._batching_logs = True
+        self._last_log_flush = time.time()
+        try:
+            yield
+        finally:
+            self._batching_logs = outer
+            if not outer:
+                self._flush_logs()
+
+    @staticmethod
+    def _graph_key(nodes: List[WorkflowNode],
+                   edges: List[WorkflowEdge]) -> Tuple[FrozenSet[str], Tuple[Tuple[str, str], ...]]:
+        """Hashable (node ids, forward edge pairs) key for the cached sort functions."""
+        node_ids = frozenset(n.id for n in nodes)
+        pairs = tuple(
+            (e.source, e.target) for e in edges
+            if not e.is_back_edge  # Skip back-edges to avoid false cycles
+            and e.source in node_ids and e.target in node_ids
+        )
+        return node_ids, pairs
 
     def _topological_sort(self, nodes: List[WorkflowNode], edges: List[WorkflowEdge]) -> List[str]:
         """Kahn's algorithm on given nodes/edges. Skips back-edges."""
-        node_ids = {n.id for n in nodes}
-        in_degree = {nid: 0 for nid in node_ids}
-        adj: Dict[str, List[str]] = {nid: [] for nid in node_ids}
+        return list(_topo_order(*self._graph_key(nodes, edges)))
 
-        for e in edges:
-            if e.is_back_edge:
-                continue  # Skip back-edges to avoid false cycles
-            if e.source in node_ids and e.target in node_ids:
-                in_degree[e.target] = in_degree.get(e.target, 0) + 1
-                adj[e.source].append(e.target)
+    def _topological_levels(self, nodes: List[WorkflowNode],
+                            edges: List[WorkflowEdge]) -> List[List[str]]:
+        """Kahn's algorithm grouped by level: nodes in a level do not depend on each other."""
+        return [list(level) for level in _topo_levels(*self._graph_key(nodes, edges))]
 
-        queue = [nid for nid, deg in in_degree.items() if deg == 0]
-        order = []
-        while queue:
-            nid = queue.pop(0)
-            order.append(nid)
-            for neighbor in adj[nid]:
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
+    def _body_steps(self, levels: List[List[str]], skip: Optional[str] = None) -> List[Any]:
+        """Turn topological levels into loop body run steps.
+
+        A str step runs inline; a list step holds two or more nodes of one
+        level whose executors are marked ``parallel_safe``, which run
+        together on the thread pool.
+        """
+        steps: List[Any] = []
+        for level in levels:
+            level = [nid for nid in level if nid != skip]
+            parallel = []
+            if self.max_workers > 1:
+                parallel = [nid for nid in level if getattr(
+                    self.executors.get(self.nodes_by_id[nid].type), "parallel_safe", False)]
+            if len(parallel) < 2:
+                parallel = []
+            steps.extend(nid for nid in level if nid not in parallel)
+            if parallel:
+                steps.append(parallel)
+        return steps
+
+    @contextmanager
+    def _body_pool(self, steps: List[Any]):
+        """Yield a thread pool if any step runs in parallel, else None."""
+        if not any(isinstance(step, list) for step in steps):
+            yield None
+            return
+        pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                  thread_name_prefix="pipestudio-node")
+        try:
+            yield pool
+        finally:
+            pool.shutdown()
+
+    def _make_node_runner(self, in_edges: Dict[str, List[WorkflowEdge]]) -> Callable[[str], Any]:
+        """Return run_node(nid) -> outputs for loop bodies.
+
+        Each node's dispatch record (executor, params, type, packed input
+        sources) is resolved once here, so an iteration does no registry or
+        model lookups. Executors marked ``pure`` are skipped when their
+        inputs are the same objects as on their previous run.
+        """
+        plan: Dict[str, Tuple[Callable, dict, str, Tuple[InputSource, ...], bool]] = {}
+        for nid, edges in in_edges.items():
+            node_def = self.nodes_by_id.get(nid)
+            if node_def is None:
+                continue
+            fn = self.executors.get(node_def.type) or _unavailable_executor(nid, node_def.type)
+            pure = getattr(fn, "pure", False)
+            plan[nid] = (fn, node_def.params or {}, node_def.type, _pack_edges(nid, edges), pure)
+
+        # Pure nodes keep one memo slot: (inputs, outputs) of their last run.
+        # The slot holds the input objects, so the identity check can't be
+        # fooled by a reused id().
+        memo: Dict[str, Tuple[Dict[str, Any], Any]] = {}
+        memo_hits = self._memo_hits
+        node_outputs = self.node_outputs
+        set_context = node_logger._set_context
+        clear_context = node_logger._clear_context
+        log_handler = self._log_handler
+        log_level = self.log_level
+
+        def run_node(nid: str) -> Any:
+            fn, params, node_type, sources, pure = plan[nid]
+            node_inputs = _gather_inputs(node_outputs, sources)
+            if pure:
+                slot = memo.get(nid)
+                if slot is not None and _same_inputs(slot[0], node_inputs):
+                    memo_hits[nid] = memo_hits.get(nid, 0) + 1
+                    return slot[1]
+            token = set_context(nid, node_type, log_handler, log_level)
+            try:
+                result = fn(params, **node_inputs)
+            finally:
+                clear_context(token)
+            if pure:
+                memo[nid] = (node_inputs, result)
+            return result
 
-        return order
+        return run_node
 
-    def _get_node_inputs(self, node_id: str, edges: List[WorkflowEdge]) -> Dict[str, Any]:
+    def _get_node_inputs(self, node_id: str,
+                         edges: Optional[List[WorkflowEdge]] = None) -> Dict[str, Any]:
         """Collect inputs for a node from upstream outputs.
 
         If multiple edges target the same port, values are collected into a list.
         Single-edge ports receive the value directly (no wrapping).
+        ``edges`` defaults to the node's indexed incoming forward edges.
         """
-        edge_stacks: Dict[str, list] = {}
-        for e in edges:
-            if e.is_back_edge:
-                continue  # Back-edges handled by loop executor
-            if e.target == node_id and e.source in self.node_outputs:
-                source_outputs = self.node_outputs[e.source]
-                if e.source_port in source_outputs:
-                    if e.target_port not in edge_stacks:
-                        edge_stacks[e.target_port] = []
-                    edge_stacks[e.target_port].append(source_outputs[e.source_port])
-
-        inputs: Dict[str, Any] = {}
-        for port_name, values in edge_stacks.items():
-            inputs[port_name] = values[0] if len(values) == 1 else values
-        return inputs
+        if edges is None:
+            edges = self._in_edges.get(node_id, [])
+        return _gather_inputs(self.node_outputs, _pack_edges(node_id, edges))
 
     # ------------------------------------------------------------------
     # Legacy loop_group (container with parent_id children)
@@ -115,7 +459,7 @@ class WorkflowExecutor:
         iterations = _clamp_iterations(node_def.params.get("iterations", 10))
         all_edges = self.workflow.edges
 
-        child_nodes = [n for n in self.workflow.nodes if n.parent_id == node_def.id]
+        child_nodes = self._children_by_parent.get(node_def.id, [])
         if not child_nodes:
             print(f"  Loop group {node_def.id} has no children, passing through")
             return inputs
@@ -139,49 +483,48 @@ class WorkflowExecutor:
         exit_candidates = child_ids - children_with_outgoing_internal
         exit_node_id = exit_candidates.pop() if exit_candidates else child_nodes[-1].id
 
+        # The body structure is iteration-invariant: rewrite entry edges to the
+        # virtual input node, sort and index incoming edges once.
+        virtual_id = "__loop_in__"
+        sub_edges = []
+        for e in internal_edges:
+            if e.source == node_def.id:
+                # Fields come from an already-validated edge: skip validation
+                sub_edges.append(WorkflowEdge.model_construct(
+                    id=e.id, source=virtual_id, source_port=e.source_port,
+                    target=e.target, target_port=e.target_port, is_back_edge=False
+                ))
+            else:
+                sub_edges.append(e)
+
+        order = self._topological_sort(child_nodes, sub_edges)
+        in_edges = {nid: [e for e in sub_edges if e.target == nid] for nid in order}
+
         current_data = dict(inputs)
-        for i in range(iterations):
-            if (i + 1) % 10 == 0 or i == 0:
-                print(f"  Loop iteration {i + 1}/{iterations}")
-                self._emit("log", level="INFO", node_id=node_def.id,
-                           node_type="loop_group",
-                           message=f"Iteration {i + 1}/{iterations}",
-                           timestamp=time.time())
 
-            virtual_id = "__loop_in__"
-            self.node_outputs[virtual_id] = current_data
+        run_node = self._make_node_runner(in_edges)
 
-            sub_edges = []
-            for e in internal_edges:
-                if e.source == node_def.id:
-                    sub_edges.append(WorkflowEdge(
-                        id=e.id, source=virtual_id, source_port=e.source_port,
-                        target=e.target, target_port=e.target_port
-                    ))
-                else:
-                    sub_edges.append(e)
+        # Bind hot attributes to locals for the iteration loop
+        node_outputs = self.node_outputs
+        log_handler = self._log_handler
 
-            sub_nodes = [n.model_copy(update={"parent_id": None}) for n in child_nodes]
+        with self._batched_logs():
+            for i in range(iterations):
+                if (i + 1) % 10 == 0 or i == 0:
+                    log_handler("INFO", node_def.id, "loop_group", f"Iteration {i + 1}/{iterations}")
 
-            order = self._topological_sort(sub_nodes, sub_edges)
-            for child_id in order:
-                child_def = self.nodes_by_id[child_id]
-                child_inputs = self._get_node_inputs(child_id, sub_edges)
+                node_outputs[virtual_id] = current_data
 
-                node_logger._set_context(child_id, child_def.type, self._log_handler)
-                try:
-                    result = self.executors[child_def.type](child_def.params or {}, **child_inputs)
-                    self.node_outputs[child_id] = result
-                finally:
-                    node_logger._clear_context()
+                for child_id in order:
+                    node_outputs[child_id] = run_node(child_id)
 
-            if exit_node_id in self.node_outputs:
-                exit_output = self.node_outputs[exit_node_id]
-                for child_port, loop_port in feedback_map.items():
-                    if child_port in exit_output:
-                        current_data[loop_port] = exit_output[child_port]
+                if exit_node_id in node_outputs:
+                    exit_output = node_outputs[exit_node_id]
+                    for child_port, loop_port in feedback_map.items():
+                        if child_port in exit_output:
+                            current_data[loop_port] = exit_output[child_port]
 
-            self.node_outputs.pop(virtual_id, None)
+                node_outputs.pop(virtual_id, None)
 
         return current_data
 
@@ -189,30 +532,35 @@ class WorkflowExecutor:
     # ComfyUI style: loop_start + loop_end pair
     # ------------------------------------------------------------------
 
-    def _find_loop_body(self, start_id: str, end_id: str) -> Set[str]:
-        """Find all nodes between loop_start and loop_end via BFS on forward edges."""
-        forward_edges = [e for e in self.workflow.edges if not e.is_back_edge]
-        adj: Dict[str, List[str]] = {}
-        for e in forward_edges:
-            adj.setdefault(e.source, []).append(e.target)
+    def _find_loop_body(self, start_id: str, end_id: str) -> FrozenSet[str]:
+        """Find all nodes between loop_start and loop_end via BFS on forward edges.
+
+        Results are memoized per (start_id, end_id) for the executor's lifetime.
+        """
+        key = (start_id, end_id)
+        cached = self._loop_body_cache.get(key)
+        if cached is not None:
+            return cached
 
         visited: Set[str] = set()
-        queue = [start_id]
+        queue = deque([start_id])
         while queue:
-            nid = queue.pop(0)
+            nid = queue.popleft()
             if nid in visited:
                 continue
             visited.add(nid)
             # Don't traverse past end_id (but include it)
             if nid == end_id:
                 continue
-            for neighbor in adj.get(nid, []):
+            for neighbor in self._forward_adj.get(nid, []):
                 if neighbor not in visited:
                     queue.append(neighbor)
 
-        return visited
+        body = frozenset(visited)
+        self._loop_body_cache[key] = body
+        return body
 
-    def _execute_comfyui_loop(self, start_node: WorkflowNode) -> Set[str]:
+    def _execute_comfyui_loop(self, start_node: WorkflowNode) -> FrozenSet[str]:
         """Execute a LoopStart+LoopEnd pair. Returns set of node IDs already executed."""
         pair_id = start_node.id
 
@@ -230,12 +578,20 @@ class WorkflowExecutor:
         # Find loop body: all nodes from start to end
         body_ids = self._find_loop_body(start_node.id, end_node.id)
         body_nodes = [self.nodes_by_id[nid] for nid in body_ids if nid in self.nodes_by_id]
-        forward_edges = [e for e in self.workflow.edges if not e.is_back_edge]
-        body_edges = [e for e in forward_edges if e.source in body_ids and e.target in body_ids]
-        body_order = self._topological_sort(body_nodes, body_edges)
+        body_edges = [e for e in self._forward_edges if e.source in body_ids and e.target in body_ids]
+        body_levels = self._topological_levels(body_nodes, body_edges)
+
+        # start_node is part of body_ids, so start→body edges are body edges too
+        in_edges = {
+            nid: [e for e in self._in_edges.get(nid, []) if e.source in body_ids]
+            for nid in body_ids
+        }
+        # Skip start, its outputs are set directly each iteration
+        body_steps = self._body_steps(body_levels, skip=start_node.id)
+        run_node = self._make_node_runner(in_edges)
 
         # Get initial inputs to loop_start from upstream
-        initial_inputs = self._get_node_inputs(start_node.id, self.workflow.edges)
+        initial_inputs = self._get_node_inputs(start_node.id)
 
         # Build current_data: maps in_N → value
         current_data = {}
@@ -245,51 +601,38 @@ class WorkflowExecutor:
 
         node_start_time = time.time()
 
-        for i in range(iterations):
-            if (i + 1) % 10 == 0 or i == 0:
-                print(f"  ComfyUI loop iteration {i + 1}/{iterations}")
-                self._emit("log", level="INFO", node_id=start_node.id,
-                           node_type="loop_start",
-                           message=f"Iteration {i + 1}/{iterations}",
-                           timestamp=time.time())
-
-            # Set loop_start outputs: in_N → out_N
-            start_outputs = {}
-            for key, value in current_data.items():
-                out_key = key.replace("in_", "out_", 1)
-                start_outputs[out_key] = value
-            self.node_outputs[start_node.id] = start_outputs
-
-            # Execute body nodes in order (skip start, it's already set)
-            for nid in body_order:
-                if nid == start_node.id:
-                    continue
-                node_def = self.nodes_by_id[nid]
-
-                node_logger._set_context(nid, node_def.type, self._log_handler)
-                try:
-                    # body_edges may already contain start→body edges; deduplicate
-                    extra = [e for e in forward_edges
-                             if e.source == start_node.id and e.target in body_ids
-                             and e not in body_edges]
-                    node_inputs = self._get_node_inputs(nid, body_edges + extra)
-                    if nid == end_node.id:
-                        # loop_end is a pass-through
-                        result = self.executors[node_def.type](node_def.params or {}, **node_inputs)
+        # Bind hot attributes to locals for the iteration loop
+        node_outputs = self.node_outputs
+        log_handler = self._log_handler
+
+        with self._batched_logs(), self._body_pool(body_steps) as pool:
+            for i in range(iterations):
+                if (i + 1) % 10 == 0 or i == 0:
+                    log_handler("INFO", start_node.id, "loop_start", f"Iteration {i + 1}/{iterations}")
+
+                # Set loop_start outputs: in_N → out_N
+                start_outputs = {}
+                for key, value in current_data.items():
+                    out_key = key.replace("in_", "out_", 1)
+                    start_outputs[out_key] = value
+                node_outputs[start_node.id] = start_outputs
+
+                # Execute body nodes level by level (loop_end is a pass-through)
+                for step in body_steps:
+                    if type(step) is str:
+                        node_outputs[step] = run_node(step)
                     else:
-                        result = self.executors[node_def.type](node_def.params or {}, **node_inputs)
-                    self.node_outputs[nid] = result
-                finally:
-                    node_logger._clear_context()
-
-            # Feedback: loop_end outputs → loop_start inputs for next iteration
-            if end_node.id in self.node_outputs:
-                end_out = self.node_outputs[end_node.id]
-                for key, value in end_out.items():
-                    # out_N → in_N
-                    in_key = key.replace("out_", "in_", 1)
-                    if in_key in current_data or value is not None:
-                        current_data[in_key] = value
+                        for nid, result in zip(step, _pool_map(pool, run_node, step)):
+                            node_outputs[nid] = result
+
+                # Feedback: loop_end outputs → loop_start inputs for next iteration
+                if end_node.id in node_outputs:
+                    end_out = node_outputs[end_node.id]
+                    for key, value in end_out.items():
+                        # out_N → in_N
+                        in_key = key.replace("out_", "in_", 1)
+                        if in_key in current_data or value is not None:
+                            current_data[in_key] = value
 
         # Record timing for the loop_start node
         duration = (time.time() - node_start_time) * 1000
@@ -309,89 +652,94 @@ class WorkflowExecutor:
         """Execute an n8n-style loop node. Returns set of chain node IDs already executed."""
         iterations = _clamp_iterations(loop_def.params.get("iterations", 10))
 
-        forward_edges = [e for e in self.workflow.edges if not e.is_back_edge]
-        back_edges = [e for e in self.workflow.edges if e.is_back_edge]
-
         # Find processing chain: nodes reachable from loop_node via loop_* ports
         loop_output_targets: Set[str] = set()
-        for e in forward_edges:
-            if e.source == loop_def.id and e.source_port.startswith("loop_"):
+        for e in self._out_edges.get(loop_def.id, []):
+            if e.source_port.startswith("loop_"):
                 loop_output_targets.add(e.target)
 
         # BFS to find all chain nodes
         chain_ids: Set[str] = set()
-        queue = list(loop_output_targets)
+        queue = deque(loop_output_targets)
         while queue:
-            nid = queue.pop(0)
+            nid = queue.popleft()
             if nid in chain_ids or nid == loop_def.id:
                 continue
             chain_ids.add(nid)
-            for e in forward_edges:
-                if e.source == nid and e.target != loop_def.id:
-                    queue.append(e.target)
+            for neighbor in self._forward_adj.get(nid, []):
+                if neighbor != loop_def.id:
+                    queue.append(neighbor)
 
         chain_nodes = [self.nodes_by_id[nid] for nid in chain_ids if nid in self.nodes_by_id]
-        chain_edges = [e for e in forward_edges if e.source in chain_ids and e.target in chain_ids]
-        chain_order = self._topological_sort(chain_nodes, chain_edges)
+        chain_edges = [e for e in self._forward_edges if e.source in chain_ids and e.target in chain_ids]
+        chain_levels = self._topological_levels(chain_nodes, chain_edges)
+        edges_for_chain = chain_edges + [
+            e for e in self._out_edges.get(loop_def.id, [])
+            if e.target in chain_ids
+        ]
+        in_edges = {nid: [e for e in edges_for_chain if e.target == nid] for nid in chain_ids}
+        chain_steps = self._body_steps(chain_levels)
+        run_node = self._make_node_runner(in_edges)
 
         # Get initial inputs
-        initial_inputs = self._get_node_inputs(loop_def.id, forward_edges)
+        initial_inputs = self._get_node_inputs(loop_def.id)
 
         # Build current_data: init_N → slot N value
-        current_data: Dict[str, Any] = {}
+        current_data: Dict[int, Any] = {}
         for key, value in initial_inputs.items():
-            if key.startswith("init_"):
-                slot = key[len("init_"):]  # "1", "2", "3"
-                current_data[slot] = value
+            if key.startswith("init_") and key[len("init_"):].isdigit():
+                current_data[int(key[len("init_"):])] = value
+
+        # Feedback back-edges into this loop: (source, source_port, slot), parsed once
+        feedback = [
+            (be.source, be.source_port, int(be.target_port[len("feedback_"):]))
+            for be in self._back_edges
+            if be.target == loop_def.id and be.target_port.startswith("feedback_")
+            and be.target_port[len("feedback_"):].isdigit()
+        ]
+        slots = set(current_data) | {slot for _, _, slot in feedback}
+        loop_keys = {slot: f"loop_{slot}" for slot in slots}
+        done_keys = {slot: f"done_{slot}" for slot in slots}
 
         node_start_time = time.time()
 
-        for i in range(iterations):
-            if (i + 1) % 10 == 0 or i == 0:
-                print(f"  n8n loop iteration {i + 1}/{iterations}")
-                self._emit("log", level="INFO", node_id=loop_def.id,
-                           node_type="loop_node",
-                           message=f"Iteration {i + 1}/{iterations}",
-                           timestamp=time.time())
+        # Bind hot attributes to locals for the iteration loop
+        node_outputs = self.node_outputs
+        log_handler = self._log_handler
+
+        with self._batched_logs(), self._body_pool(chain_steps) as pool:
+            for i in range(iterations):
+                if (i + 1) % 10 == 0 or i == 0:
+                    log_handler("INFO", loop_def.id, "loop_node", f"Iteration {i + 1}/{iterations}")
+
+                # Set loop_* outputs
+                loop_outputs: Dict[str, Any] = {}
+                for slot, value in current_data.items():
+                    loop_outputs[loop_keys[slot]] = value
+                # Also set done_* (will be overwritten after final iteration, but needed for topology)
+                for slot, value in current_data.items():
+                    loop_outputs[done_keys[slot]] = value
+                node_outputs[loop_def.id] = loop_outputs
+
+                # Execute chain nodes level by level
+                for step in chain_steps:
+                    if type(step) is str:
+                        node_outputs[step] = run_node(step)
+                    else:
+                        for nid, result in zip(step, _pool_map(pool, run_node, step)):
+                            node_outputs[nid] = result
 
-            # Set loop_* outputs
-            loop_outputs: Dict[str, Any] = {}
-            for slot, value in current_data.items():
-                loop_outputs[f"loop_{slot}"] = value
-            # Also set done_* (will be overwritten after final iteration, but needed for topology)
-            for slot, value in current_data.items():
-                loop_outputs[f"done_{slot}"] = value
-            self.node_outputs[loop_def.id] = loop_outputs
-
-            # Execute chain nodes
-            edges_for_chain = chain_edges + [
-                e for e in forward_edges
-                if e.source == loop_def.id and e.target in chain_ids
-            ]
-            for nid in chain_order:
-                node_def = self.nodes_by_id[nid]
-                node_logger._set_context(nid, node_def.type, self._log_handler)
-                try:
-                    node_inputs = self._get_node_inputs(nid, edges_for_chain)
-                    result = self.executors[node_def.type](node_def.params or {}, **node_inputs)
-                    self.node_outputs[nid] = result
-                finally:
-                    node_logger._clear_context()
-
-            # Read feedback from back-edges
-            for be in back_edges:
-                if be.target == loop_def.id and be.target_port.startswith("feedback_"):
-                    slot = be.target_port[len("feedback_"):]  # "1", "2", "3"
-                    if be.source in self.node_outputs:
-                        src_out = self.node_outputs[be.source]
-                        if be.source_port in src_out:
-                            current_data[slot] = src_out[be.source_port]
+                # Read feedback from back-edges
+                for source, source_port, slot in feedback:
+                    src_out = node_outputs.get(source)
+                    if src_out is not None and source_port in src_out:
+                        current_data[slot] = src_out[source_port]
 
         # After all iterations, set done_* outputs for downstream
         done_outputs: Dict[str, Any] = {}
         for slot, value in current_data.items():
-            done_outputs[f"loop_{slot}"] = value
-            done_outputs[f"done_{slot}"] = value
+            done_outputs[loop_keys[slot]] = value
+            done_outputs[done_keys[slot]] = value
         self.node_outputs[loop_def.id] = done_outputs
 
         # Record timing
@@ -412,7 +760,7 @@ class WorkflowExecutor:
         top_nodes = [n for n in self.workflow.nodes if n.parent_id is None]
         top_ids = {n.id for n in top_nodes}
         top_edges = [
-            e for e in self.workflow.edges
+            e for e in self._forward_edges
             if e.source in top_ids and e.target in top_ids
         ]
 
@@ -435,7 +783,7 @@ class WorkflowExecutor:
             self._emit("node_start", node_id=node_id, node_label=node_def.type)
             print(f"[{idx + 1}/{total}] Executing {node_def.type} ({node_id})")
 
-            inputs = self._get_node_inputs(node_id, self.workflow.edges)
+            inputs = self._get_node_inputs(node_id)
             params = node_def.params or {}
 
             # Breakpoints
@@ -504,11 +852,12 @@ class WorkflowExecutor:
                             reason="inactive or not installed",
                         )
                     # Normal node execution
-                    node_logger._set_context(node_id, node_def.type, self._log_handler)
+                    token = node_logger._set_context(node_id, node_def.type, self._log_handler,
+                                                     self.log_level)
                     try:
                         result = self.executors[node_def.type](params, **inputs)
                     finally:
-                        node_logger._clear_context()
+                        node_logger._clear_context(token)
 
                     self.node_outputs[node_id] = result
                     duration = (time.time() - node_start) * 1000
@@ -543,6 +892,7 @@ class WorkflowExecutor:
             slowest_node=max(self._node_timings, key=self._node_timings.get)
             if self._node_timings
             else None,
+            memo_hits=dict(self._memo_hits),
         )
 
         self._emit("complete", total_ms=total_ms)
@@ -554,25 +904,6 @@ class WorkflowExecutor:
         """Create a JSON-safe summary of node input/output data for breakpoint events."""
         summary: Dict[str, Any] = {}
         for key, value in data.items():
-            if isinstance(value, np.ndarray):
-                summary[key] = {
-                    "_type": "array",
-                    "shape": list(value.shape),
-                    "dtype": str(value.dtype),
-                    "length": int(value.shape[0]) if value.ndim >= 1 else 1,
-                }
-            elif isinstance(value, dict) and value.get("_type") == "array":
-                summary[key] = value
-            elif isinstance(value, (int, float, str, bool)):
-                summary[key] = value
-            elif callable(value):
-                name = getattr(value, '__name__', type(value).__name__)
-                summary[key] = {"_type": "function", "name": name}
-            elif isinstance(value, (list, tuple)):
-                summary[key] = {
-                    "_type": "list",
-                    "length": len(value),
-                }
-            else:
-                summary[key] = {"_type": type(value).__name__}
+            summarize = _SUMMARIZERS.get(type(value))
+            summary[key] = summarize(value) if summarize else _summarize_fallback(value)
         return summary
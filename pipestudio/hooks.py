@@ -6,6 +6,28 @@ Supported hooks: on_activate, on_deactivate, on_uninstall.
 import importlib.util
 import os
 import sys
+from types import ModuleType
+from typing import Dict, Tuple
+
+# hooks_path -> ((mtime_ns, size), module); re-executed only when the file changes
+_HOOKS_CACHE: Dict[str, Tuple[Tuple[int, int], ModuleType]] = {}
+
+
+def _load_hooks_module(plugin_dir: str, hooks_path: str) -> ModuleType:
+    """Return the hooks module for hooks_path, importing it only if it changed on disk."""
+    st = os.stat(hooks_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _HOOKS_CACHE.get(hooks_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    module_name = f"_pipestudio_hooks_{os.path.basename(plugin_dir)}"
+    spec = importlib.util.spec_from_file_location(module_name, hooks_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    _HOOKS_CACHE[hooks_path] = (stamp, module)
+    return module
 
 
 def run_hook(plugin_dir: str, hook_name: str) -> None:
@@ -19,14 +41,7 @@ def run_hook(plugin_dir: str, hook_name: str) -> None:
         return
 
     try:
-        module_name = f"_pipestudio_hooks_{os.path.basename(plugin_dir)}"
-        if module_name in sys.modules:
-            del sys.modules[module_name]
-        spec = importlib.util.spec_from_file_location(module_name, hooks_path)
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[module_name] = module
-        spec.loader.exec_module(module)
-
+        module = _load_hooks_module(plugin_dir, hooks_path)
         fn = getattr(module, hook_name, None)
         if fn is not None and callable(fn):
             fn()
@@ -3,14 +3,59 @@
 Plugin authors only need to import from this module:
     from pipestudio.plugin_api import logger
 """
+import os
 import warnings
-from typing import Callable, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from types import MappingProxyType
+from typing import Callable, Iterator, List, Mapping, Optional, Tuple
 
 
 # --- Node registry (filled by plugin loader via register_node) ---
 
 _NODE_REGISTRY: dict = {}
 _EXECUTORS: dict = {}
+_REGISTRY_VIEW = MappingProxyType(_NODE_REGISTRY)
+# node_type -> NODE_INFO its current spec was built from
+_NODE_INFOS: dict = {}
+# Bumped whenever register_node/unregister_node changes the registry
+_registry_version = 0
+
+# (captured node types, staged registrations or None) while the plugin
+# loader imports a module
+_registration_capture: ContextVar[Optional[Tuple[List[str], Optional[list]]]] = ContextVar(
+    "pipestudio_registration_capture", default=None
+)
+
+
+@contextmanager
+def _capture_registrations(staged: Optional[list] = None) -> Iterator[List[str]]:
+    """Collect the node types passed to register_node inside the block.
+
+    If ``staged`` is given, registrations are not applied: their
+    (node_info, executor_fn) arguments are appended to it instead, for the
+    caller to register later.
+    """
+    captured: List[str] = []
+    token = _registration_capture.set((captured, staged))
+    try:
+        yield captured
+    finally:
+        _registration_capture.reset(token)
+
+
+def _same_node_info(old: Optional[dict], new: dict) -> bool:
+    """True if ``new`` is the NODE_INFO ``old`` was registered from.
+
+    Values that cannot be compared to a bool (e.g. numpy array port
+    defaults) count as changed.
+    """
+    if old is new:
+        return True
+    try:
+        return bool(old == new)
+    except (ValueError, TypeError):
+        return False
 
 
 def register_node(node_info: dict, executor_fn: Callable = None) -> None:
@@ -19,8 +64,20 @@ def register_node(node_info: dict, executor_fn: Callable = None) -> None:
     If executor_fn is None, only the spec is registered (e.g. loop_group
     which is handled entirely by the executor engine).
     """
+    global _registry_version
     node_type = node_info["type"]
+    capture = _registration_capture.get()
+    if capture is not None:
+        capture[0].append(node_type)
+        if capture[1] is not None:
+            capture[1].append((node_info, executor_fn))
+            return
     if node_type in _NODE_REGISTRY:
+        if _same_node_info(_NODE_INFOS.get(node_type), node_info):
+            # Same definition again (e.g. a plugin re-activated): keep the spec
+            if executor_fn is not None:
+                _EXECUTORS[node_type] = executor_fn
+            return
         warnings.warn(f"Duplicate node type '{node_type}' — overwriting previous registration")
     spec = {
         "type": node_type,
@@ -49,13 +106,18 @@ def register_node(node_info: dict, executor_fn: Callable = None) -> None:
         ],
     }
     _NODE_REGISTRY[node_type] = spec
+    _NODE_INFOS[node_type] = node_info
+    _registry_version += 1
     if executor_fn is not None:
         _EXECUTORS[node_type] = executor_fn
 
 
 def unregister_node(node_type: str) -> None:
     """Remove a node type from registry and executors. Silent if not found."""
-    _NODE_REGISTRY.pop(node_type, None)
+    global _registry_version
+    if _NODE_REGISTRY.pop(node_type, None) is not None:
+        _registry_version += 1
+    _NODE_INFOS.pop(node_type, None)
     _EXECUTORS.pop(node_type, None)
 
 
@@ -64,6 +126,24 @@ def get_registry() -> dict:
     return dict(_NODE_REGISTRY)
 
 
+def get_registry_view() -> Mapping[str, dict]:
+    """Return a live read-only view of the node registry (no copy)."""
+    return _REGISTRY_VIEW
+
+
+def get_registry_version() -> int:
+    """Counter that changes whenever a node type is (re)registered or removed.
+
+    Pair it with len(get_registry_view()) to also catch a bulk clear().
+    """
+    return _registry_version
+
+
+def get_node_spec(node_type: str) -> Optional[dict]:
+    """Return the registered spec for node_type, or None."""
+    return _NODE_REGISTRY.get(node_type)
+
+
 def get_executors() -> dict:
     """Return a copy of the executor functions."""
     return dict(_EXECUTORS)
@@ -71,33 +151,55 @@ def get_executors() -> dict:
 
 # --- Logger ---
 
+# Severity order of NodeLogger levels
+LOG_LEVELS = ("DEBUG", "INFO", "WARN", "ERROR")
+_LEVEL_RANK = {level: rank for rank, level in enumerate(LOG_LEVELS)}
+
+# Lowest level emitted when a run does not choose one
+LOG_LEVEL_ENV = "PIPESTUDIO_LOG_LEVEL"
+_DEFAULT_THRESHOLD = _LEVEL_RANK.get(os.environ.get(LOG_LEVEL_ENV, "DEBUG").upper(), 0)
+
+# (node_id, node_type, handler, threshold) of the node currently running in
+# this context. ContextVar keeps it per thread, so nodes on worker threads
+# log correctly.
+_log_context: ContextVar[Optional[Tuple[str, str, Callable, int]]] = ContextVar(
+    "pipestudio_log_context", default=None
+)
+
+
 class NodeLogger:
     """Logger that tags messages with node context.
 
     Executor sets context before each node runs, clears after.
-    Plugin authors just call logger.info(), logger.debug(), etc.
+    Plugin authors just call logger.info(), logger.debug(), etc. Messages
+    below the run's log level (PIPESTUDIO_LOG_LEVEL by default) are dropped;
+    nodes that build expensive messages can check is_enabled_for() first.
     """
 
-    def __init__(self):
-        self._handler: Optional[Callable] = None
-        self._node_id: Optional[str] = None
-        self._node_type: Optional[str] = None
+    def _set_context(self, node_id: str, node_type: str, handler: Callable,
+                     level: Optional[str] = None) -> Token:
+        threshold = _DEFAULT_THRESHOLD if level is None else _LEVEL_RANK[level]
+        return _log_context.set((node_id, node_type, handler, threshold))
 
-    def _set_context(self, node_id: str, node_type: str, handler: Callable):
-        self._node_id = node_id
-        self._node_type = node_type
-        self._handler = handler
+    def _clear_context(self, token: Optional[Token] = None):
+        if token is not None:
+            _log_context.reset(token)
+        else:
+            _log_context.set(None)
 
-    def _clear_context(self):
-        self._node_id = None
-        self._node_type = None
-        self._handler = None
+    def is_enabled_for(self, level: str) -> bool:
+        """True if a message at ``level`` would be emitted by the running node."""
+        ctx = _log_context.get()
+        threshold = _DEFAULT_THRESHOLD if ctx is None else ctx[3]
+        return _LEVEL_RANK[level] >= threshold
 
     def _emit(self, level: str, message: str):
-        if self._handler:
-            self._handler(level, self._node_id, self._node_type, message)
-        else:
-            print(f"[{level}] [{self._node_type}:{self._node_id}] {message}")
+        ctx = _log_context.get()
+        if ctx is not None:
+            if _LEVEL_RANK[level] >= ctx[3]:
+                ctx[2](level, ctx[0], ctx[1], message)
+        elif _LEVEL_RANK[level] >= _DEFAULT_THRESHOLD:
+            print(f"[{level}] [None:None] {message}")
 
     def debug(self, message: str):
         self._emit("DEBUG", message)
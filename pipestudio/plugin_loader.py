@@ -20,10 +20,54 @@ Also supports legacy layout for backwards compatibility:
 import importlib.util
 import json
 import os
+import shutil
 import sys
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from types import CodeType
+from typing import Any, Dict, List, Optional, Tuple
 
-from pipestudio.plugin_api import _NODE_REGISTRY, _EXECUTORS, unregister_node, register_node
+from pipestudio.plugin_api import (
+    _NODE_REGISTRY, _EXECUTORS, _capture_registrations, unregister_node, register_node,
+)
+
+
+# --- Directory scanning ---
+
+_entry_name = attrgetter("name")
+
+
+def _scan_dir(path: str) -> Dict[str, os.DirEntry]:
+    """List a directory once, as {name: DirEntry} in name order.
+
+    DirEntry caches the file type from the directory read, so the
+    is_dir()/is_file() checks below cost no extra stat calls. Name order
+    is load order: it decides which plugin wins a duplicate node type, so
+    it must not depend on the filesystem.
+    """
+    with os.scandir(path) as it:
+        return {entry.name: entry for entry in sorted(it, key=_entry_name)}
+
+
+# --- JSON files (manifests, state) ---
+
+# path -> ((mtime_ns, size), parsed dict); re-parsed only when the file changes
+_JSON_CACHE: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+
+
+def _load_json_cached(path: str) -> Dict:
+    """Parse a JSON object file, reusing the last parse while the file is unchanged.
+
+    Returns a shallow copy: callers may add or pop top-level keys freely.
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path, "r", encoding="utf-8") as f:
+            cached = (stamp, json.load(f))
+        _JSON_CACHE[path] = cached
+    return dict(cached[1])
 
 
 # --- State file ---
@@ -33,14 +77,14 @@ def _read_state_file(plugins_dir: str) -> Dict[str, str]:
     state_path = os.path.join(plugins_dir, "plugins_state.json")
     if not os.path.exists(state_path):
         return {}
-    with open(state_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_json_cached(state_path)
 
 
 def _write_state_file(plugins_dir: str, state: Dict[str, str]) -> None:
     """Write plugins_state.json. Removes default ('active') entries to keep file clean."""
     clean = {k: v for k, v in state.items() if v != "active"}
     state_path = os.path.join(plugins_dir, "plugins_state.json")
+    _JSON_CACHE.pop(state_path, None)
     with open(state_path, "w", encoding="utf-8") as f:
         json.dump(clean, f, indent=2)
 
@@ -54,9 +98,7 @@ def _get_plugin_state(state: Dict[str, str], plugin_id: str) -> str:
 
 def _merge_manifests(base: Dict, override: Dict) -> Dict:
     """Shallow merge: override's keys replace base's keys."""
-    merged = dict(base)
-    merged.update(override)
-    return merged
+    return {**base, **override}
 
 
 # --- Convention-based executor wrapper ---
@@ -69,31 +111,65 @@ def _make_executor(module):
     2. Builds a positional arg list matching ports_in order
     3. Calls run(*args)
     4. Wraps the return value (single or tuple) into a dict matching ports_out
+
+    The wrapper is generated per node type: each positional argument is
+    an inline params -> inputs -> default lookup, so a call builds no
+    merged dict. The wrapper carries a ``pure`` attribute taken from NODE_INFO.
     """
     run_fn = module.run
     node_info = module.NODE_INFO
-    in_names = [p["name"] for p in node_info.get("ports_in", [])]
     out_names = [p["name"] for p in node_info.get("ports_out", [])]
-    defaults = {}
-    for p in node_info.get("ports_in", []):
-        if p.get("default") is not None:
-            defaults[p["name"]] = p["default"]
-
-    def executor(params, **inputs):
-        merged = dict(defaults)
-        merged.update(inputs)
-        merged.update(params)
-        positional = [merged.get(name) for name in in_names]
-        result = run_fn(*positional)
-        if len(out_names) == 1:
-            return {out_names[0]: result}
-        return dict(zip(out_names, result))
 
+    namespace: Dict[str, Any] = {"_run": run_fn, "_out_names": tuple(out_names)}
+    args = []
+    for i, p in enumerate(node_info.get("ports_in", [])):
+        name = p["name"]
+        # Same precedence as merging defaults, then inputs, then params
+        if p.get("default") is None:
+            args.append(f"params[{name!r}] if {name!r} in params else inputs.get({name!r})")
+        else:
+            namespace[f"_d{i}"] = p["default"]
+            args.append(f"params[{name!r}] if {name!r} in params else inputs.get({name!r}, _d{i})")
+    if len(out_names) == 1:
+        wrap = f"{{{out_names[0]!r}: result}}"
+    else:
+        wrap = "dict(zip(_out_names, result))"
+    source = (
+        "def executor(params, **inputs):\n"
+        f"    result = _run({', '.join(args)})\n"
+        f"    return {wrap}\n"
+    )
+    exec(compile(source, f"<executor {node_info.get('type')}>", "exec"), namespace)
+    executor = namespace["executor"]
+
+    # NODE_INFO "pure": same inputs give the same outputs, with no side effects
+    # worth repeating; loop bodies may reuse the last result
+    executor.pure = bool(node_info.get("pure", False))
+    # NODE_INFO "parallel_safe": may run on a worker thread alongside other
+    # nodes of the same loop body level; opt-in, as plugin code may share state
+    executor.parallel_safe = bool(node_info.get("parallel_safe", False))
     return executor
 
 
 # --- Module import ---
 
+# path -> ((mtime_ns, size), code object); recompiled only when the file changes
+_CODE_CACHE: Dict[str, Tuple[Tuple[int, int], CodeType]] = {}
+
+
+def _compiled_source(path: str) -> CodeType:
+    """Return the compiled code for a plugin file, reusing it while the file is unchanged."""
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CODE_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(path, "rb") as f:
+        code = compile(f.read(), path, "exec")
+    _CODE_CACHE[path] = (stamp, code)
+    return code
+
+
 def _import_module(name: str, path: str):
     """Import a Python file as a module. Supports both convention (NODE_INFO + run)
     and legacy (@node decorator) registration."""
@@ -102,7 +178,7 @@ def _import_module(name: str, path: str):
     spec = importlib.util.spec_from_file_location(name, path)
     module = importlib.util.module_from_spec(spec)
     sys.modules[name] = module
-    spec.loader.exec_module(module)
+    exec(_compiled_source(path), module.__dict__)
 
     # Convention-based registration
     if hasattr(module, "NODE_INFO"):
@@ -116,72 +192,150 @@ def _import_module(name: str, path: str):
 
 # --- Single plugin loading ---
 
-def _load_single_plugin(plugin_path: str, project_name: str, plugin_name: str) -> Dict[str, Any]:
-    """Load a single plugin (file or folder). Returns info dict with node types added."""
-    before = set(_NODE_REGISTRY.keys())
-
-    if os.path.isfile(plugin_path) and plugin_path.endswith(".py"):
-        # Simple plugin: single .py file
-        module_name = f"pipestudio_plugin_{project_name}_{plugin_name}"
-        _import_module(module_name, plugin_path)
-    elif os.path.isdir(plugin_path):
-        init_path = os.path.join(plugin_path, "__init__.py")
-        if os.path.exists(init_path):
+# Worker threads for importing a project's plugins concurrently
+MAX_IMPORT_WORKERS = 8
+
+# plugin_id ("project/plugin") -> node types it registered on its last load
+_PLUGIN_OWNERSHIP: Dict[str, List[str]] = {}
+
+
+def _load_single_plugin(plugin_path: str, project_name: str, plugin_name: str,
+                        listing: Optional[Dict[str, os.DirEntry]] = None,
+                        staged: Optional[list] = None) -> Dict[str, Any]:
+    """Load a single plugin (file or folder). Returns info dict with node types added.
+
+    ``listing`` is the folder's _scan_dir() result, if the caller already has it.
+    With ``staged``, registrations are collected there instead of applied
+    (see _capture_registrations).
+    """
+    with _capture_registrations(staged) as registered:
+        if listing is None and os.path.isdir(plugin_path):
+            listing = _scan_dir(plugin_path)
+
+        if listing is None:
+            if plugin_path.endswith(".py") and os.path.isfile(plugin_path):
+                # Simple plugin: single .py file
+                module_name = f"pipestudio_plugin_{project_name}_{plugin_name}"
+                _import_module(module_name, plugin_path)
+        elif "__init__.py" in listing:
             # Complex plugin: folder with __init__.py
             module_name = f"pipestudio_plugin_{project_name}_{plugin_name}"
-            _import_module(module_name, init_path)
+            _import_module(module_name, listing["__init__.py"].path)
         else:
             # Check for .py files directly (legacy-style nodes dir)
-            for fname in sorted(os.listdir(plugin_path)):
-                if not fname.endswith(".py") or fname.startswith("_"):
+            for fname, entry in listing.items():
+                if fname.startswith("_") or not fname.endswith(".py"):
                     continue
-                fpath = os.path.join(plugin_path, fname)
                 mod_name = f"pipestudio_plugin_{project_name}_{fname[:-3]}"
-                _import_module(mod_name, fpath)
+                _import_module(mod_name, entry.path)
 
-    after = set(_NODE_REGISTRY.keys())
-    new_nodes = after - before
+    node_types = sorted(set(registered))
+    _PLUGIN_OWNERSHIP[f"{project_name}/{plugin_name}"] = node_types
     return {
-        "node_types": sorted(new_nodes),
-        "node_count": len(new_nodes),
+        "node_types": node_types,
+        "node_count": len(node_types),
     }
 
 
 # --- Project loading ---
 
-def _load_project(project_dir: str, project_name: str, state: Dict[str, str]) -> Dict[str, Any]:
-    """Load all plugins from a project folder. Returns project manifest with plugin info."""
-    manifest_path = os.path.join(project_dir, "manifest.json")
-    if not os.path.exists(manifest_path):
+# project_dir -> (fingerprint, result, registrations, ownership) of its last
+# clean load; an unchanged project is restored from here instead of re-imported
+_PROJECT_CACHE: Dict[str, Tuple[tuple, Dict[str, Any], list, Dict[str, List[str]]]] = {}
+
+
+def _project_fingerprint(project_dir: str, project_name: str, state: Dict[str, str]) -> tuple:
+    """Stamp every .py/.json file under a project, plus the project's plugin states."""
+    stamps = []
+    pending = [project_dir]
+    while pending:
+        with os.scandir(pending.pop()) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if entry.name != "__pycache__":
+                        pending.append(entry.path)
+                elif entry.name.endswith((".py", ".json")):
+                    st = entry.stat()
+                    stamps.append((entry.path, st.st_mtime_ns, st.st_size))
+    prefix = project_name + "/"
+    states = frozenset(item for item in state.items() if item[0].startswith(prefix))
+    return frozenset(stamps), states
+
+
+def _forget_project(plugins_dir: str, plugin_id: str) -> None:
+    """Drop the cached load of the project a plugin belongs to."""
+    project_name, _ = _split_plugin_id(plugin_id)
+    _PROJECT_CACHE.pop(os.path.join(plugins_dir, project_name), None)
+
+
+def _load_project(project_dir: str, project_name: str, state: Dict[str, str],
+                  listing: Optional[Dict[str, os.DirEntry]] = None) -> Dict[str, Any]:
+    """Load all plugins from a project folder. Returns project manifest with plugin info.
+
+    ``listing`` is the project folder's _scan_dir() result, if the caller already has it.
+    If no file or plugin state changed since the last clean load, the
+    project's registrations are replayed without importing anything.
+    """
+    if listing is None:
+        listing = _scan_dir(project_dir)
+    if "manifest.json" not in listing:
         return {"name": project_name, "_loaded": False, "_error": "No manifest.json"}
 
-    with open(manifest_path, "r", encoding="utf-8") as f:
-        base_manifest = json.load(f)
+    fingerprint = _project_fingerprint(project_dir, project_name, state)
+    cached = _PROJECT_CACHE.get(project_dir)
+    if cached is not None and cached[0] == fingerprint:
+        _, result, registrations, ownership = cached
+        for node_info, executor_fn in registrations:
+            register_node(node_info, executor_fn)
+        _PLUGIN_OWNERSHIP.update(ownership)
+        return dict(result)
+
+    base_manifest = _load_json_cached(listing["manifest.json"].path)
+    registrations: list = []  # (node_info, executor_fn) in registration order
 
-    nodes_dir = os.path.join(project_dir, "nodes")
-    nodes_file = os.path.join(project_dir, "nodes.py")
+    nodes_entry = listing.get("nodes")
 
     all_node_types = set()
     plugins_info = []
 
-    if os.path.isdir(nodes_dir):
-        for entry in sorted(os.listdir(nodes_dir)):
-            entry_path = os.path.join(nodes_dir, entry)
-
+    if nodes_entry is not None and nodes_entry.is_dir():
+        # (plugin_id, plugin_type, path, plugin_name, folder listing) in name order
+        entries = []
+        for entry_name, entry in _scan_dir(nodes_entry.path).items():
             # Determine plugin name and type
-            if os.path.isfile(entry_path) and entry.endswith(".py") and not entry.startswith("_"):
-                plugin_name = entry[:-3]  # strip .py
-                plugin_type = "file"
-            elif os.path.isdir(entry_path) and not entry.startswith("_"):
-                plugin_name = entry
-                plugin_type = "directory"
-            else:
+            if entry_name.startswith("_"):
                 continue
+            if entry_name.endswith(".py") and entry.is_file():
+                entries.append((f"{project_name}/{entry_name[:-3]}", "file",
+                                entry.path, entry_name[:-3], None))
+            elif entry.is_dir():
+                entries.append((f"{project_name}/{entry_name}", "directory",
+                                entry.path, entry_name, _scan_dir(entry.path)))
+
+        def load(item):
+            plugin_id, _, entry_path, plugin_name, plugin_listing = item
+            staged: list = []
+            try:
+                info = _load_single_plugin(entry_path, project_name, plugin_name,
+                                           plugin_listing, staged)
+                return staged, info, None
+            except Exception as e:
+                return staged, None, e
+
+        # Imports run concurrently; registrations are staged and applied below
+        # in name order, so the registry comes out the same on every load.
+        active = [item for item in entries if _get_plugin_state(state, item[0]) != "inactive"]
+        workers = min(MAX_IMPORT_WORKERS, len(active))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers,
+                                    thread_name_prefix="pipestudio-import") as pool:
+                loaded = dict(zip((item[0] for item in active), pool.map(load, active)))
+        else:
+            loaded = {item[0]: load(item) for item in active}
 
-            plugin_id = f"{project_name}/{plugin_name}"
-
+        for plugin_id, plugin_type, _, _, plugin_listing in entries:
             # Check state
-            if _get_plugin_state(state, plugin_id) == "inactive":
+            if plugin_id not in loaded:
                 plugins_info.append({
                     "id": plugin_id,
                     "type": plugin_type,
@@ -190,50 +344,63 @@ def _load_project(project_dir: str, project_name: str, state: Dict[str, str]) ->
                 })
                 continue
 
-            # Load child manifest for folder plugins
-            child_manifest = {}
-            if plugin_type == "directory":
-                child_manifest_path = os.path.join(entry_path, "manifest.json")
-                if os.path.exists(child_manifest_path):
-                    with open(child_manifest_path, "r", encoding="utf-8") as f:
-                        child_manifest = json.load(f)
+            staged, info, error = loaded[plugin_id]
+            for node_info, executor_fn in staged:
+                register_node(node_info, executor_fn)
+            registrations.extend(staged)
 
-            try:
-                info = _load_single_plugin(entry_path, project_name, plugin_name)
-                all_node_types.update(info["node_types"])
-                plugins_info.append({
-                    "id": plugin_id,
-                    "type": plugin_type,
-                    "state": "active",
-                    "node_types": info["node_types"],
-                    "manifest_override": child_manifest if child_manifest else None,
-                })
-            except Exception as e:
+            if error is not None:
                 plugins_info.append({
                     "id": plugin_id,
                     "type": plugin_type,
                     "state": "error",
-                    "error": str(e),
+                    "error": str(error),
                     "node_types": [],
                 })
+                continue
+
+            # Load child manifest for folder plugins
+            child_manifest = {}
+            if plugin_listing is not None and "manifest.json" in plugin_listing:
+                child_manifest = _load_json_cached(plugin_listing["manifest.json"].path)
+
+            all_node_types.update(info["node_types"])
+            plugins_info.append({
+                "id": plugin_id,
+                "type": plugin_type,
+                "state": "active",
+                "node_types": info["node_types"],
+                "manifest_override": child_manifest if child_manifest else None,
+            })
 
-    elif os.path.exists(nodes_file):
+    elif "nodes.py" in listing:
         # Legacy: single nodes.py in project root
         plugin_id = f"{project_name}/nodes"
         if _get_plugin_state(state, plugin_id) != "inactive":
             module_name = f"pipestudio_plugin_{project_name}"
-            before = set(_NODE_REGISTRY.keys())
-            _import_module(module_name, nodes_file)
-            after = set(_NODE_REGISTRY.keys())
-            new_nodes = after - before
-            all_node_types.update(new_nodes)
-
-    result = dict(base_manifest)
-    result["_loaded"] = True
-    result["_path"] = project_dir
-    result["_node_count"] = len(all_node_types)
-    result["_node_types"] = sorted(all_node_types)
-    result["_plugins"] = plugins_info
+            with _capture_registrations(registrations) as registered:
+                _import_module(module_name, listing["nodes.py"].path)
+            for node_info, executor_fn in registrations:
+                register_node(node_info, executor_fn)
+            _PLUGIN_OWNERSHIP[plugin_id] = sorted(set(registered))
+            all_node_types.update(registered)
+
+    result = {
+        **base_manifest,
+        "_loaded": True,
+        "_path": project_dir,
+        "_node_count": len(all_node_types),
+        "_node_types": sorted(all_node_types),
+        "_plugins": plugins_info,
+    }
+
+    # Failed plugins are retried on the next load (e.g. after installing a
+    # missing dependency), so only clean loads are cached
+    if not any(p["state"] == "error" for p in plugins_info):
+        prefix = project_name + "/"
+        ownership = {pid: types for pid, types in _PLUGIN_OWNERSHIP.items()
+                     if pid.startswith(prefix)}
+        _PROJECT_CACHE[project_dir] = (fingerprint, dict(result), registrations, ownership)
     return result
 
 
@@ -246,39 +413,93 @@ def load_plugins(plugins_dir: str) -> List[Dict[str, Any]]:
         return results
 
     state = _read_state_file(plugins_dir)
+    log_lines: List[str] = []  # written in one go after the scan
 
-    for entry in sorted(os.listdir(plugins_dir)):
-        project_path = os.path.join(plugins_dir, entry)
-        if not os.path.isdir(project_path):
-            continue
+    for entry, dir_entry in _scan_dir(plugins_dir).items():
         # Skip hidden/internal dirs
-        if entry.startswith(".") or entry.startswith("_"):
+        if entry.startswith((".", "_")):
             continue
-        manifest_path = os.path.join(project_path, "manifest.json")
-        if not os.path.exists(manifest_path):
+        if not dir_entry.is_dir():
             continue
-
-        try:
-            result = _load_project(project_path, entry, state)
+        result = _load_project_entry(dir_entry.path, entry, state, log_lines)
+        if result is not None:
             results.append(result)
-            total = len(_NODE_REGISTRY)
-            print(f"  Project '{result.get('name', entry)}' loaded: {total} total nodes")
-        except Exception as e:
-            results.append({
-                "name": entry,
-                "_loaded": False,
-                "_error": str(e),
-                "_path": project_path,
-            })
-            print(f"  Project '{entry}' FAILED: {e}")
 
+    if log_lines:
+        sys.stdout.write("\n".join(log_lines) + "\n")
     return results
 
 
+def _load_project_entry(project_path: str, entry: str, state: Dict[str, str],
+                        log_lines: List[str]) -> Optional[Dict[str, Any]]:
+    """Load one project folder for load_plugins/load_project; None if it has no manifest."""
+    listing = _scan_dir(project_path)
+    if "manifest.json" not in listing:
+        return None
+
+    try:
+        result = _load_project(project_path, entry, state, listing)
+        total = len(_NODE_REGISTRY)
+        log_lines.append(f"  Project '{result.get('name', entry)}' loaded: {total} total nodes")
+        return result
+    except Exception as e:
+        log_lines.append(f"  Project '{entry}' FAILED: {e}")
+        return {
+            "name": entry,
+            "_loaded": False,
+            "_error": str(e),
+            "_path": project_path,
+        }
+
+
+def unload_project(project_name: str) -> None:
+    """Unregister every node type owned by one project's plugins."""
+    prefix = project_name + "/"
+    for plugin_id in [pid for pid in _PLUGIN_OWNERSHIP if pid.startswith(prefix)]:
+        for node_type in _PLUGIN_OWNERSHIP.pop(plugin_id):
+            unregister_node(node_type)
+
+
+def load_project(plugins_dir: str, project_name: str) -> Optional[Dict[str, Any]]:
+    """Reload a single project folder, leaving every other project untouched.
+
+    Returns the project's manifest, or None if the folder (or its
+    manifest.json) no longer exists. Used by the plugin mutation endpoints,
+    which only ever change one project; reload_plugins stays the full rescan.
+    """
+    unload_project(project_name)
+    project_path = os.path.join(plugins_dir, project_name)
+    if not os.path.isdir(project_path):
+        return None
+
+    log_lines: List[str] = []
+    result = _load_project_entry(project_path, project_name,
+                                 _read_state_file(plugins_dir), log_lines)
+    if log_lines:
+        sys.stdout.write("\n".join(log_lines) + "\n")
+    return result
+
+
+def _split_plugin_id(plugin_id: str) -> Tuple[str, str]:
+    """Parse "project/plugin_name" into its two parts."""
+    parts = plugin_id.split("/", 1)
+    if len(parts) != 2:
+        raise ValueError(f"Invalid plugin_id: {plugin_id}")
+    return parts[0], parts[1]
+
+
+def _plugin_paths(plugins_dir: str, plugin_id: str) -> Tuple[str, str]:
+    """Return (py_path, dir_path): the two places a plugin can live on disk."""
+    project_name, plugin_name = _split_plugin_id(plugin_id)
+    stem = os.path.join(plugins_dir, project_name, "nodes", plugin_name)
+    return stem + ".py", stem
+
+
 def reload_plugins(plugins_dir: str) -> List[Dict[str, Any]]:
     """Clear registries and reload all plugins. Used for hot-reload."""
     _NODE_REGISTRY.clear()
     _EXECUTORS.clear()
+    _PLUGIN_OWNERSHIP.clear()
     return load_plugins(plugins_dir)
 
 
@@ -287,17 +508,11 @@ def activate_plugin(plugins_dir: str, plugin_id: str) -> None:
     state = _read_state_file(plugins_dir)
     state.pop(plugin_id, None)  # Remove entry (default is active)
     _write_state_file(plugins_dir, state)
-
-    # Parse plugin_id: "project/plugin_name"
-    parts = plugin_id.split("/", 1)
-    if len(parts) != 2:
-        raise ValueError(f"Invalid plugin_id: {plugin_id}")
-    project_name, plugin_name = parts
+    _forget_project(plugins_dir, plugin_id)
 
     # Find and load the plugin
-    nodes_dir = os.path.join(plugins_dir, project_name, "nodes")
-    py_path = os.path.join(nodes_dir, f"{plugin_name}.py")
-    dir_path = os.path.join(nodes_dir, plugin_name)
+    project_name, plugin_name = _split_plugin_id(plugin_id)
+    py_path, dir_path = _plugin_paths(plugins_dir, plugin_id)
 
     if os.path.isfile(py_path):
         _load_single_plugin(py_path, project_name, plugin_name)
@@ -309,28 +524,29 @@ def activate_plugin(plugins_dir: str, plugin_id: str) -> None:
 
 def deactivate_plugin(plugins_dir: str, plugin_id: str) -> None:
     """Deactivate a plugin: update state file and unregister its nodes."""
+    _split_plugin_id(plugin_id)  # reject a malformed id before touching state
     state = _read_state_file(plugins_dir)
     state[plugin_id] = "inactive"
     _write_state_file(plugins_dir, state)
+    _forget_project(plugins_dir, plugin_id)
+
+    # A type another plugin also registered (duplicate overwrite) stays:
+    # that plugin is reloaded so its spec, not this one's, is registered
+    survivors = set()
+    for node_type in _PLUGIN_OWNERSHIP.pop(plugin_id, []):
+        owners = [pid for pid, types in _PLUGIN_OWNERSHIP.items() if node_type in types]
+        if owners:
+            survivors.update(owners)
+        else:
+            unregister_node(node_type)
 
-    # Find which node types belong to this plugin and unregister them
-    # We need to check what's currently registered by re-scanning
-    parts = plugin_id.split("/", 1)
-    if len(parts) != 2:
-        raise ValueError(f"Invalid plugin_id: {plugin_id}")
-    project_name, plugin_name = parts
-
-    # Try to determine node types from the plugin file/folder
-    nodes_dir = os.path.join(plugins_dir, project_name, "nodes")
-    py_path = os.path.join(nodes_dir, f"{plugin_name}.py")
-    dir_path = os.path.join(nodes_dir, plugin_name)
-
-    # Simple heuristic: unregister nodes that match the plugin name
-    # For a more robust approach, we'd track which plugin registered which nodes
-    # For now, reload everything to get clean state
-    _NODE_REGISTRY.clear()
-    _EXECUTORS.clear()
-    load_plugins(plugins_dir)
+    for owner_id in sorted(survivors):
+        project_name, plugin_name = _split_plugin_id(owner_id)
+        py_path, dir_path = _plugin_paths(plugins_dir, owner_id)
+        if os.path.isfile(py_path):
+            _load_single_plugin(py_path, project_name, plugin_name)
+        elif os.path.isdir(dir_path):
+            _load_single_plugin(dir_path, project_name, plugin_name)
 
 
 def delete_plugin(plugins_dir: str, plugin_id: str) -> None:
@@ -341,16 +557,8 @@ def delete_plugin(plugins_dir: str, plugin_id: str) -> None:
             f"Plugin '{plugin_id}' must be deactivated before deletion."
         )
 
-    parts = plugin_id.split("/", 1)
-    if len(parts) != 2:
-        raise ValueError(f"Invalid plugin_id: {plugin_id}")
-    project_name, plugin_name = parts
-
-    nodes_dir = os.path.join(plugins_dir, project_name, "nodes")
-    py_path = os.path.join(nodes_dir, f"{plugin_name}.py")
-    dir_path = os.path.join(nodes_dir, plugin_name)
+    py_path, dir_path = _plugin_paths(plugins_dir, plugin_id)
 
-    import shutil
     if os.path.isfile(py_path):
         os.remove(py_path)
     elif os.path.isdir(dir_path):
@@ -359,6 +567,8 @@ def delete_plugin(plugins_dir: str, plugin_id: str) -> None:
         raise FileNotFoundError(f"Plugin not found on disk: {plugin_id}")
 
     # Clean up state entry
+    _forget_project(plugins_dir, plugin_id)
+    _PLUGIN_OWNERSHIP.pop(plugin_id, None)
     state.pop(plugin_id, None)
     _write_state_file(plugins_dir, state)
 
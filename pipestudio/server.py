@@ -1,40 +1,120 @@
 """PipeStudio FastAPI server."""
+import asyncio
 import json
 import os
+import shutil
+import tempfile
+import threading
 import time
+import zipfile
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple
 
 import numpy as np
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, UploadFile, File
+import orjson
+from fastapi import (
+    BackgroundTasks, FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect, UploadFile,
+    File,
+)
+from fastapi.encoders import jsonable_encoder
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel
 
 from pipestudio import __version__
 from pipestudio.models import WorkflowNode, WorkflowEdge, WorkflowDefinition
 from pipestudio.plugin_loader import (
-    load_plugins, reload_plugins, get_full_registry,
+    load_plugins, reload_plugins, load_project, get_full_registry,
     activate_plugin, deactivate_plugin, delete_plugin,
     _read_state_file, _write_state_file, _get_plugin_state,
 )
 from pipestudio.executor import WorkflowExecutor
 from pipestudio.hooks import run_hook
+from pipestudio.plugin_api import get_registry_version, get_registry_view
+from pipestudio.validator import validate_workflow
+
+try:
+    import psutil
+    _PROCESS = psutil.Process()
+except ImportError:
+    _PROCESS = None
 
 # --- State ---
 
 PLUGINS_DIR = os.path.join(os.path.dirname(__file__), "..", "plugins")
+# Resolved once: abspath() costs a getcwd() and would follow a cwd change
+ABS_PLUGINS_DIR = os.path.abspath(PLUGINS_DIR)
 _manifests: List[Dict] = []
 _start_time = time.time()
+# (registry version, registry size) -> rendered /api/workflow/nodes body.
+# Keyed on the registry itself so any register_node/unregister_node call,
+# not only the plugin endpoints, invalidates it
+_registry_json: Optional[Tuple[Tuple[int, int], bytes]] = None
+# Rendered /api/plugins body and the plugin part of /api/health, rebuilt
+# from _manifests by _set_manifests (the only place _manifests changes)
+_plugins_json: bytes = b"[]"
+_health_plugins: List[Dict] = []
+# Serializes registry/manifest mutations from concurrent requests
+_plugins_lock = threading.Lock()
+
+
+def _set_manifests(manifests: List[Dict]) -> None:
+    """Install new manifests, rebuild their views and drop the cached registry."""
+    global _manifests, _registry_json, _plugins_json, _health_plugins
+    _manifests = manifests
+    _registry_json = None
+    _plugins_json = _dumps([
+        {
+            "project": m.get("name", "unknown"),
+            "manifest": {
+                "name": m.get("name", "unknown"),
+                "version": m.get("version", "0.0.0"),
+                "description": m.get("description", ""),
+                "categories": m.get("categories", {}),
+            },
+            "status": "ok" if m.get("_loaded") else "error",
+            "error": m.get("_error"),
+            "plugins": m.get("_plugins", []),
+        }
+        for m in manifests
+    ])
+    _health_plugins = [
+        {
+            "name": m.get("name", "unknown"),
+            "status": "ok" if m.get("_loaded") else "error",
+            "error": m.get("_error"),
+        }
+        for m in manifests
+    ]
+
+
+def _reload_plugins(plugins_dir: str) -> None:
+    """Reload all plugins, refresh the manifests and drop the cached registry."""
+    with _plugins_lock:
+        _set_manifests(reload_plugins(plugins_dir))
+
+
+def _reload_project(plugins_dir: str, project: str) -> None:
+    """Reload one project folder and swap its entry in the manifests list."""
+    with _plugins_lock:
+        manifest = load_project(plugins_dir, project)
+        manifests = [m for m in _manifests
+                     if os.path.basename(m.get("_path", "")) != project]
+        if manifest is not None:
+            manifests.append(manifest)
+            # Same order as a full scan (project folder name)
+            manifests.sort(key=lambda m: os.path.basename(m.get("_path", "")))
+        _set_manifests(manifests)
 
 
 # --- Lifespan ---
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global _manifests
-    abs_plugins = os.path.abspath(PLUGINS_DIR)
-    print(f"Loading plugins from: {abs_plugins}")
-    _manifests = reload_plugins(abs_plugins)
+    print(f"Loading plugins from: {ABS_PLUGINS_DIR}")
+    _reload_plugins(ABS_PLUGINS_DIR)
     loaded = [m["name"] for m in _manifests if m.get("_loaded")]
     failed = [m["name"] for m in _manifests if not m.get("_loaded")]
     print(f"Plugins loaded: {loaded}")
@@ -43,9 +123,39 @@ async def lifespan(app: FastAPI):
     yield
 
 
+# --- JSON responses ---
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for values it can't encode natively (e.g. non-contiguous arrays)."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return jsonable_encoder(obj)
+
+
+def _dumps(content: Any) -> bytes:
+    """Serialize to JSON bytes with orjson, numpy-aware."""
+    return orjson.dumps(
+        content,
+        default=_json_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered by orjson, with native numpy support."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+
 # --- App setup ---
 
-app = FastAPI(title="PipeStudio", version=__version__, lifespan=lifespan)
+app = FastAPI(title="PipeStudio", version=__version__, lifespan=lifespan,
+              default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -62,24 +172,49 @@ app.add_middleware(
 
 # --- WebSocket manager ---
 
+# A client that doesn't take a message within SEND_TIMEOUT seconds is dropped
+SEND_TIMEOUT = 5.0
+MAX_CONCURRENT_SENDS = 100
+
+# Events per "batch" frame when an execution's events are broadcast
+WS_BATCH_SIZE = 128
+
+
 class ConnectionManager:
+    """Tracks /ws/execution clients and fans execution events out to them.
+
+    No socket tuning is done here: asyncio already enables TCP_NODELAY on
+    every TCP transport, and the executor coalesces chatty loop logs into
+    "log_batch" events before they reach the wire.
+    """
+
     def __init__(self):
-        self.connections: List[WebSocket] = []
+        self.connections: Set[WebSocket] = set()
+        self._send_slots = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
 
     async def connect(self, ws: WebSocket):
         await ws.accept()
-        self.connections.append(ws)
+        self.connections.add(ws)
 
     def disconnect(self, ws: WebSocket):
-        if ws in self.connections:
-            self.connections.remove(ws)
+        self.connections.discard(ws)
+
+    async def _send(self, ws: WebSocket, text: str):
+        async with self._send_slots:
+            await asyncio.wait_for(ws.send_text(text), SEND_TIMEOUT)
 
     async def broadcast(self, message: dict):
-        for ws in list(self.connections):
-            try:
-                await ws.send_json(message)
-            except Exception:
-                pass
+        """Send to all clients concurrently; clients that fail or stall are dropped."""
+        if not self.connections:
+            return
+        text = _dumps(message).decode()
+        targets = list(self.connections)
+        results = await asyncio.gather(
+            *(self._send(ws, text) for ws in targets), return_exceptions=True
+        )
+        for ws, result in zip(targets, results):
+            if isinstance(result, Exception):
+                self.disconnect(ws)
 
 
 ws_manager = ConnectionManager()
@@ -96,40 +231,73 @@ async def ws_execution(ws: WebSocket):
         ws_manager.disconnect(ws)
 
 
+# --- Execution event buffer ---
+
+MAX_BUFFERED_EVENTS = 5000
+
+# Lifecycle events are bounded by node count and always kept; only log
+# traffic is dropped once the buffer is full.
+_DROPPABLE_EVENTS = {"log", "log_batch"}
+
+
+class EventBuffer:
+    """Bounded collector for one execution's events.
+
+    Once ``maxlen`` events are held, further log events are dropped. The next
+    kept event is preceded by a single "lagged" notice carrying the number of
+    dropped events and the seq of the last one, so clients can show the gap.
+    """
+
+    def __init__(self, maxlen: int = MAX_BUFFERED_EVENTS):
+        self.maxlen = maxlen
+        self.events: List[dict] = []
+        self._dropped = 0
+        self._last_dropped_seq = None
+
+    def __call__(self, event_type: str, data: dict):
+        if event_type in _DROPPABLE_EVENTS and len(self.events) >= self.maxlen:
+            self._dropped += 1
+            self._last_dropped_seq = data.get("seq")
+            return
+        if self._dropped:
+            self.events.append({"event": "lagged", "dropped": self._dropped,
+                                "last_seq": self._last_dropped_seq})
+            self._dropped = 0
+        self.events.append({"event": event_type, **data})
+
+
 # --- Serialization ---
 
+def _summarize_array(val: np.ndarray) -> Dict[str, Any]:
+    """Stats summary sent in place of an array over 100 elements."""
+    # Vectorized: one C-level pass per statistic. sorted_ratio is
+    # taken over the flattened values, so it is defined for any ndim.
+    flat = val.ravel()
+    descents = np.count_nonzero(flat[:-1] > flat[1:])
+    return {
+        "_type": "array",
+        "length": len(val),
+        # Left as arrays: orjson writes them in C without boxing each element
+        "first_10": np.ascontiguousarray(val[:10]),
+        "last_10": np.ascontiguousarray(val[-10:]),
+        "min": float(flat.min()),
+        "max": float(flat.max()),
+        "mean": float(flat.mean()),
+        "sorted_ratio": float(1.0 - descents / max(flat.size - 1, 1)),
+    }
+
+
 def serialize_outputs(outputs: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert numpy arrays and types to JSON-safe format."""
+    """Summarize large arrays; small arrays and numpy scalars are left for orjson."""
+    ndarray = np.ndarray
     result = {}
     for node_id, node_out in outputs.items():
         if node_id.startswith("__"):
             continue
-        serialized = {}
-        for key, val in node_out.items():
-            if isinstance(val, np.ndarray):
-                if len(val) > 100:
-                    serialized[key] = {
-                        "_type": "array",
-                        "length": len(val),
-                        "first_10": val[:10].tolist(),
-                        "last_10": val[-10:].tolist(),
-                        "min": float(val.min()),
-                        "max": float(val.max()),
-                        "mean": float(val.mean()),
-                        "sorted_ratio": float(
-                            1.0 - sum(1 for i in range(len(val) - 1) if val[i] > val[i + 1])
-                            / max(len(val) - 1, 1)
-                        ),
-                    }
-                else:
-                    serialized[key] = val.tolist()
-            elif isinstance(val, (np.integer,)):
-                serialized[key] = int(val)
-            elif isinstance(val, (np.floating,)):
-                serialized[key] = float(val)
-            else:
-                serialized[key] = val
-        result[node_id] = serialized
+        result[node_id] = {
+            key: _summarize_array(val) if isinstance(val, ndarray) and len(val) > 100 else val
+            for key, val in node_out.items()
+        }
     return result
 
 
@@ -160,37 +328,55 @@ def serialize_event(event: dict) -> dict:
 @app.get("/api/workflow/nodes")
 def get_nodes():
     """Return node registry from all loaded plugins."""
-    return get_full_registry()
+    global _registry_json
+    stamp = (get_registry_version(), len(get_registry_view()))
+    if _registry_json is None or _registry_json[0] != stamp:
+        _registry_json = (stamp, ORJSONResponse(get_full_registry()).body)
+    return Response(_registry_json[1], media_type="application/json")
 
 
 class ExecuteRequest(BaseModel):
     name: str = "workflow"
     description: str = ""
-    nodes: List[Dict[str, Any]]
-    edges: List[Dict[str, Any]]
+    # Parsed into models once, during request binding
+    nodes: List[WorkflowNode]
+    edges: List[WorkflowEdge]
+    # Lowest plugin log level to record for this run (default: PIPESTUDIO_LOG_LEVEL)
+    log_level: Optional[Literal["DEBUG", "INFO", "WARN", "ERROR"]] = None
+
+
+async def _broadcast_events(items: List[dict]) -> None:
+    """Send serialized execution events to WebSocket clients, WS_BATCH_SIZE per frame."""
+    for i in range(0, len(items), WS_BATCH_SIZE):
+        await ws_manager.broadcast({"event": "batch", "items": items[i:i + WS_BATCH_SIZE]})
+
+
+@app.exception_handler(RequestValidationError)
+async def _validation_error(request: Request, exc: RequestValidationError):
+    """Standard 422; a malformed execute request is also reported to WebSocket clients."""
+    if request.url.path == "/api/workflow/execute":
+        await ws_manager.broadcast({"event": "error", "message": str(exc)})
+    return await request_validation_exception_handler(request, exc)
 
 
 @app.post("/api/workflow/execute")
 async def execute_workflow(req: ExecuteRequest):
     """Execute a workflow and return results."""
     try:
-        nodes = [WorkflowNode(**n) for n in req.nodes]
-        edges = [WorkflowEdge(**e) for e in req.edges]
-        wf = WorkflowDefinition(name=req.name, nodes=nodes, edges=edges)
-
-        events = []
-
-        def event_handler(event_type, data):
-            events.append({"event": event_type, **data})
+        wf = WorkflowDefinition(name=req.name, nodes=req.nodes, edges=req.edges)
 
-        executor = WorkflowExecutor(wf, event_handler=event_handler)
-        raw = executor.execute()
+        events = EventBuffer()
+        executor = WorkflowExecutor(wf, event_handler=events, log_level=req.log_level)
+        # Off the event loop: node compute no longer stalls other requests or
+        # WebSocket traffic. The executor serializes event_handler calls itself.
+        raw = await asyncio.to_thread(executor.execute)
 
-        # Broadcast events to WebSocket clients
-        for evt in events:
-            await ws_manager.broadcast(serialize_event(evt))
+        # Sent before the response: a late node_start/node_complete would
+        # overwrite the results the client takes from the HTTP body
+        await _broadcast_events([serialize_event(evt) for evt in events.events])
 
-        return serialize_outputs(raw)
+        # Rendered straight by orjson: skips jsonable_encoder's walk over arrays
+        return ORJSONResponse(serialize_outputs(raw))
     except Exception as e:
         await ws_manager.broadcast({"event": "error", "message": str(e)})
         raise HTTPException(status_code=500, detail=str(e))
@@ -199,40 +385,65 @@ async def execute_workflow(req: ExecuteRequest):
 @app.post("/api/workflow/validate")
 def validate_workflow_endpoint(req: ExecuteRequest):
     """Validate a workflow and return issues."""
-    from pipestudio.validator import validate_workflow
-    nodes = [WorkflowNode(**n) for n in req.nodes]
-    edges = [WorkflowEdge(**e) for e in req.edges]
-    wf = WorkflowDefinition(name=req.name, nodes=nodes, edges=edges)
+    wf = WorkflowDefinition(name=req.name, nodes=req.nodes, edges=req.edges)
     return validate_workflow(wf)
 
 
+# example path -> ((mtime_ns, size), name, node types) from its last parse
+_EXAMPLE_CACHE: Dict[str, Tuple[Tuple[int, int], str, frozenset]] = {}
+# (registry version, registry size, file stamps) -> /api/workflow/examples body
+_examples_listing: Tuple[Optional[tuple], List[Dict]] = (None, [])
+
+
+def _example_summary(path: str, fname: str, stamp: Tuple[int, int]) -> Tuple[str, frozenset]:
+    """(name, node types) of an example file, re-parsed only when it changes."""
+    cached = _EXAMPLE_CACHE.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path, "rb") as fh:
+            data = orjson.loads(fh.read())
+        node_types = frozenset(node.get("type", "") for node in data.get("nodes", []))
+        cached = (stamp, data.get("name", fname), node_types)
+        _EXAMPLE_CACHE[path] = cached
+    return cached[1], cached[2]
+
+
 @app.get("/api/workflow/examples")
 def list_examples():
-    """List available example workflows with availability info."""
+    """List available example workflows with availability info.
+
+    The listing is rebuilt only when an example file or the registry changes.
+    """
+    global _examples_listing
     examples_dir = os.path.join(os.path.dirname(__file__), "..", "examples")
     if not os.path.exists(examples_dir):
         return []
-    registry = get_full_registry()
+    registry = get_registry_view()
+    with os.scandir(examples_dir) as it:
+        files = []
+        for e in it:
+            if e.name.endswith(".json"):
+                st = e.stat()
+                files.append((e.name, e.path, (st.st_mtime_ns, st.st_size)))
+    files.sort()
+    key = (get_registry_version(), len(registry), tuple((f[0], f[2]) for f in files))
+    if _examples_listing[0] == key:
+        return _examples_listing[1]
+
     result = []
-    for f in sorted(os.listdir(examples_dir)):
-        if f.endswith(".json"):
-            path = os.path.join(examples_dir, f)
-            with open(path, "r", encoding="utf-8") as fh:
-                data = json.load(fh)
-            # Check which node types in the workflow are missing from registry
-            missing_nodes = set()
-            for node in data.get("nodes", []):
-                node_type = node.get("type", "")
-                if node_type and node_type not in registry and node_type != "loop_group":
-                    missing_nodes.add(node_type)
-            entry = {
-                "filename": f,
-                "name": data.get("name", f),
-                "available": len(missing_nodes) == 0,
-            }
-            if missing_nodes:
-                entry["missing_nodes"] = sorted(missing_nodes)
-            result.append(entry)
+    for fname, path, stamp in files:
+        name, node_types = _example_summary(path, fname, stamp)
+        # Check which node types in the workflow are missing from registry
+        missing_nodes = {t for t in node_types
+                         if t and t not in registry and t != "loop_group"}
+        entry = {
+            "filename": fname,
+            "name": name,
+            "available": len(missing_nodes) == 0,
+        }
+        if missing_nodes:
+            entry["missing_nodes"] = sorted(missing_nodes)
+        result.append(entry)
+    _examples_listing = (key, result)
     return result
 
 
@@ -245,33 +456,19 @@ def load_example(filename: str):
     path = os.path.join(os.path.dirname(__file__), "..", "examples", safe_name)
     if not os.path.exists(path):
         raise HTTPException(404, "Example not found")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Already JSON on disk: served as-is (sendfile) instead of parse + re-encode
+    return FileResponse(path, media_type="application/json")
 
 
 @app.get("/api/plugins")
 def list_plugins():
     """List plugins in hierarchical project → plugins format."""
-    return [
-        {
-            "project": m.get("name", "unknown"),
-            "manifest": {
-                "name": m.get("name", "unknown"),
-                "version": m.get("version", "0.0.0"),
-                "description": m.get("description", ""),
-                "categories": m.get("categories", {}),
-            },
-            "status": "ok" if m.get("_loaded") else "error",
-            "error": m.get("_error"),
-            "plugins": m.get("_plugins", []),
-        }
-        for m in _manifests
-    ]
+    return Response(_plugins_json, media_type="application/json")
 
 
 def _plugin_dir(project: str, plugin: str) -> str:
     """Resolve plugin directory path for hooks."""
-    nodes_dir = os.path.join(os.path.abspath(PLUGINS_DIR), project, "nodes")
+    nodes_dir = os.path.join(ABS_PLUGINS_DIR, project, "nodes")
     dir_path = os.path.join(nodes_dir, plugin)
     if os.path.isdir(dir_path):
         return dir_path
@@ -283,13 +480,11 @@ def _plugin_dir(project: str, plugin: str) -> str:
 @app.post("/api/plugins/{project}/{plugin}/activate")
 def activate_single_plugin(project: str, plugin: str):
     """Activate a single plugin."""
-    global _manifests
     plugin_id = f"{project}/{plugin}"
-    abs_plugins = os.path.abspath(PLUGINS_DIR)
     try:
-        activate_plugin(abs_plugins, plugin_id)
+        activate_plugin(ABS_PLUGINS_DIR, plugin_id)
         run_hook(_plugin_dir(project, plugin), "on_activate")
-        _manifests = reload_plugins(abs_plugins)
+        _reload_project(ABS_PLUGINS_DIR, project)
         return {"status": "activated", "id": plugin_id}
     except FileNotFoundError:
         raise HTTPException(404, f"Plugin '{plugin_id}' not found")
@@ -300,13 +495,11 @@ def activate_single_plugin(project: str, plugin: str):
 @app.post("/api/plugins/{project}/{plugin}/deactivate")
 def deactivate_single_plugin(project: str, plugin: str):
     """Deactivate a single plugin."""
-    global _manifests
     plugin_id = f"{project}/{plugin}"
-    abs_plugins = os.path.abspath(PLUGINS_DIR)
     try:
         run_hook(_plugin_dir(project, plugin), "on_deactivate")
-        deactivate_plugin(abs_plugins, plugin_id)
-        _manifests = reload_plugins(abs_plugins)
+        deactivate_plugin(ABS_PLUGINS_DIR, plugin_id)
+        _reload_project(ABS_PLUGINS_DIR, project)
         return {"status": "deactivated", "id": plugin_id}
     except Exception as e:
         raise HTTPException(500, str(e))
@@ -315,46 +508,40 @@ def deactivate_single_plugin(project: str, plugin: str):
 @app.post("/api/plugins/{project}/activate")
 def activate_project(project: str):
     """Activate all plugins in a project."""
-    global _manifests
-    abs_plugins = os.path.abspath(PLUGINS_DIR)
-    state = _read_state_file(abs_plugins)
+    state = _read_state_file(ABS_PLUGINS_DIR)
     # Remove inactive entries for this project
     keys_to_remove = [k for k in state if k.startswith(f"{project}/")]
     for k in keys_to_remove:
         state.pop(k)
-    _write_state_file(abs_plugins, state)
-    _manifests = reload_plugins(abs_plugins)
+    _write_state_file(ABS_PLUGINS_DIR, state)
+    _reload_project(ABS_PLUGINS_DIR, project)
     return {"status": "activated", "project": project}
 
 
 @app.post("/api/plugins/{project}/deactivate")
 def deactivate_project(project: str):
     """Deactivate all plugins in a project."""
-    global _manifests
-    abs_plugins = os.path.abspath(PLUGINS_DIR)
     # Find all plugins in this project from current manifests
     project_manifest = [m for m in _manifests if m.get("name") == project]
     if not project_manifest:
         raise HTTPException(404, f"Project '{project}' not found")
     plugin_ids = [p["id"] for p in project_manifest[0].get("_plugins", [])]
-    state = _read_state_file(abs_plugins)
+    state = _read_state_file(ABS_PLUGINS_DIR)
     for pid in plugin_ids:
         state[pid] = "inactive"
-    _write_state_file(abs_plugins, state)
-    _manifests = reload_plugins(abs_plugins)
+    _write_state_file(ABS_PLUGINS_DIR, state)
+    _reload_project(ABS_PLUGINS_DIR, project)
     return {"status": "deactivated", "project": project}
 
 
 @app.delete("/api/plugins/{project}/{plugin}")
 def delete_single_plugin(project: str, plugin: str):
     """Delete a plugin from disk. Must be inactive first."""
-    global _manifests
     plugin_id = f"{project}/{plugin}"
-    abs_plugins = os.path.abspath(PLUGINS_DIR)
     try:
         run_hook(_plugin_dir(project, plugin), "on_uninstall")
-        delete_plugin(abs_plugins, plugin_id)
-        _manifests = reload_plugins(abs_plugins)
+        delete_plugin(ABS_PLUGINS_DIR, plugin_id)
+        _reload_project(ABS_PLUGINS_DIR, project)
         return {"status": "deleted", "id": plugin_id}
     except ValueError as e:
         raise HTTPException(400, str(e))
@@ -362,92 +549,127 @@ def delete_single_plugin(project: str, plugin: str):
         raise HTTPException(404, f"Plugin '{plugin_id}' not found on disk")
 
 
-@app.post("/api/plugins/install")
-async def install_plugin(file: UploadFile = File(...)):
-    """Install a plugin from a ZIP file."""
-    import zipfile
-    import io
+# Uploads above this spill from memory to a temp file; members stream in chunks
+UPLOAD_SPOOL_SIZE = 32 * 1024 * 1024
+COPY_CHUNK_SIZE = 1 << 20
+
+
+def _extract_plugin(zf, members: Dict[str, str]) -> None:
+    """Stream validated ZIP members (name -> target path) to disk."""
+    for member, target in members.items():
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with zf.open(member) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+
 
-    content = await file.read()
+async def _extract_and_reload(spool, zf, members: Dict[str, str], plugin_name: str) -> None:
+    """Background half of install: extract, hot-reload, then notify clients."""
     try:
-        zf = zipfile.ZipFile(io.BytesIO(content))
-    except zipfile.BadZipFile:
-        raise HTTPException(400, "Invalid ZIP file")
+        await asyncio.to_thread(_extract_plugin, zf, members)
+        await asyncio.to_thread(_reload_project, ABS_PLUGINS_DIR, plugin_name)
+    except Exception as e:
+        await ws_manager.broadcast({"event": "plugin_error", "name": plugin_name, "message": str(e)})
+        return
+    finally:
+        zf.close()
+        spool.close()
+    await ws_manager.broadcast({"event": "plugin_installed", "name": plugin_name})
 
-    # Find manifest.json to determine plugin name
+
+def _validate_plugin_zip(zf) -> Tuple[Dict[str, str], str]:
+    """Check manifest and member paths; return ({member: target path}, plugin name)."""
+    names = zf.namelist()
+
+    # One pass: Zip Slip protection (reject absolute or traversal paths) and
+    # locate manifest.json to determine plugin name
     manifest_path = None
-    for name in zf.namelist():
-        if name.endswith("manifest.json") and name.count("/") <= 1:
+    for name in names:
+        if name.startswith(("/", "\\")) or ".." in name:
+            raise HTTPException(400, f"Unsafe path in ZIP: {name}")
+        if manifest_path is None and name.endswith("manifest.json") and name.count("/") <= 1:
             manifest_path = name
-            break
 
     if not manifest_path:
         raise HTTPException(400, "No manifest.json found in ZIP")
 
-    manifest = json.loads(zf.read(manifest_path))
+    try:
+        manifest = json.loads(zf.read(manifest_path))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        raise HTTPException(400, "Invalid manifest.json")
+    if not isinstance(manifest, dict):
+        raise HTTPException(400, "Invalid manifest.json")
     plugin_name = manifest.get("name", "unknown")
-
-    # Zip Slip protection: reject ZIPs with absolute or traversal paths
-    plugins_root = os.path.normpath(os.path.abspath(PLUGINS_DIR))
-    for member in zf.namelist():
-        if member.startswith("/") or member.startswith("\\") or ".." in member:
-            raise HTTPException(400, f"Unsafe path in ZIP: {member}")
-
-    # Extract to plugins directory
-    plugin_dir = os.path.normpath(os.path.join(plugins_root, plugin_name))
-    os.makedirs(plugin_dir, exist_ok=True)
-
+    if not isinstance(plugin_name, str):
+        raise HTTPException(400, "Invalid manifest.json")
+
+    # Resolve every target up front so unsafe paths are still rejected with 400
+    plugin_dir = os.path.normpath(os.path.join(ABS_PLUGINS_DIR, plugin_name))
+    if (plugin_dir == ABS_PLUGINS_DIR
+            or os.path.commonpath((ABS_PLUGINS_DIR, plugin_dir)) != ABS_PLUGINS_DIR):
+        raise HTTPException(400, f"Unsafe plugin name in manifest: {plugin_name}")
     prefix = manifest_path.rsplit("manifest.json", 1)[0]
-    for member in zf.namelist():
+    members: Dict[str, str] = {}
+    for member in names:
         if member.startswith(prefix) and not member.endswith("/"):
             rel_path = member[len(prefix):]
             target = os.path.normpath(os.path.join(plugin_dir, rel_path))
-            if not target.startswith(plugin_dir + os.sep) and target != plugin_dir:
+            if os.path.commonpath((plugin_dir, target)) != plugin_dir:
                 raise HTTPException(400, f"Unsafe path in ZIP: {member}")
-            os.makedirs(os.path.dirname(target), exist_ok=True)
-            with open(target, "wb") as f:
-                f.write(zf.read(member))
+            members[member] = target
 
-    # Hot-reload: reload all plugins so new nodes are available immediately
-    global _manifests
-    _manifests = reload_plugins(os.path.abspath(PLUGINS_DIR))
+    return members, plugin_name
 
-    return {"status": "installed", "name": plugin_name, "message": f"Plugin '{plugin_name}' installed and loaded."}
 
+@app.post("/api/plugins/install", status_code=202)
+async def install_plugin(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
+    """Accept a plugin ZIP; extraction and reload run after the response.
+
+    Clients are notified over the WebSocket with ``plugin_installed`` (or
+    ``plugin_error``) once the new nodes are available.
+    """
+    # Copy the upload into our own spool: it outlives the request (the
+    # background task reads it) and is never held as one bytes object
+    spool = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE)
+    await asyncio.to_thread(shutil.copyfileobj, file.file, spool, COPY_CHUNK_SIZE)
+    spool.seek(0)
+    try:
+        zf = zipfile.ZipFile(spool)
+    except zipfile.BadZipFile:
+        spool.close()
+        raise HTTPException(400, "Invalid ZIP file")
+
+    try:
+        members, plugin_name = _validate_plugin_zip(zf)
+    except BaseException:
+        zf.close()
+        spool.close()
+        raise
+
+    background_tasks.add_task(_extract_and_reload, spool, zf, members, plugin_name)
+
+    return {"status": "installing", "name": plugin_name, "message": f"Plugin '{plugin_name}' is being installed."}
 
 
 @app.post("/api/plugins/reload")
 def reload_all_plugins():
     """Reload all plugins (hot-reload)."""
-    global _manifests
-    _manifests = reload_plugins(os.path.abspath(PLUGINS_DIR))
+    _reload_plugins(ABS_PLUGINS_DIR)
     loaded = [m["name"] for m in _manifests if m.get("_loaded")]
-    return {"status": "reloaded", "plugins": loaded, "node_count": len(get_full_registry())}
+    return {"status": "reloaded", "plugins": loaded, "node_count": len(get_registry_view())}
 
 
 @app.get("/api/health")
 def health():
     """Health check with system metrics."""
-    mem_mb = 0
-    try:
-        import psutil
-        mem_mb = round(psutil.Process().memory_info().rss / 1024 / 1024, 1)
-    except ImportError:
-        pass
+    mem_mb = round(_PROCESS.memory_info().rss / 1024 / 1024, 1) if _PROCESS else 0
 
-    return {
+    plugins = _health_plugins
+    return ORJSONResponse({
         "status": "healthy",
         "version": __version__,
         "uptime_seconds": round(time.time() - _start_time),
-        "plugins_loaded": len([m for m in _manifests if m.get("_loaded")]),
-        "plugins": [
-            {
-                "name": m.get("name", "unknown"),
-                "status": "ok" if m.get("_loaded") else "error",
-                "error": m.get("_error"),
-            }
-            for m in _manifests
-        ],
+        "plugins_loaded": sum(1 for p in plugins if p["status"] == "ok"),
+        "plugins": plugins,
         "memory_mb": mem_mb,
         "websocket_clients": len(ws_manager.connections),
-    }
+    })
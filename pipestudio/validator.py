@@ -3,13 +3,69 @@
 Validates a WorkflowDefinition and returns a list of issues, each a dict:
     {"level": "error"|"warning"|"info", "node_id": str|None, "message": str}
 """
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Set, Tuple
 
-from pipestudio.models import WorkflowDefinition, WorkflowNode, WorkflowEdge
-from pipestudio.plugin_api import _NODE_REGISTRY
+from pipestudio.models import WorkflowDefinition, WorkflowEdge
+from pipestudio.plugin_api import get_registry_version, get_registry_view
 
-# Node types handled by the executor (not in _NODE_REGISTRY but still valid)
-_EXECUTOR_TYPES = {"loop_group"}
+# Node types handled by the executor (not in the registry but still valid)
+_EXECUTOR_TYPES = frozenset({"loop_group"})
+
+# Ports that receive data from loop feedback (not from edges)
+_FEEDBACK_PORTS = {"loop_end": frozenset({"in_1", "in_2", "in_3"}),
+                   "loop_node": frozenset({"feedback_1", "feedback_2", "feedback_3"})}
+
+# Loop plumbing is allowed to have no edges of its own
+_SKIP_ISOLATED = frozenset({"loop_group", "loop_start", "loop_end", "loop_node"})
+
+_NO_PORTS: frozenset = frozenset()
+
+# node_type -> (spec, names of its required, non-feedback input ports). The
+# spec is kept to detect re-registration: a new spec object means recompute.
+_REQUIRED_PORTS: Dict[str, Tuple[dict, Tuple[str, ...]]] = {}
+
+
+def _required_ports(node_type: str, spec: dict) -> Tuple[str, ...]:
+    """Input ports of a node type that must be fed by an edge, in port order."""
+    cached = _REQUIRED_PORTS.get(node_type)
+    if cached is not None and cached[0] is spec:
+        return cached[1]
+    skip_ports = _FEEDBACK_PORTS.get(node_type, _NO_PORTS)
+    ports = tuple(
+        port["name"] for port in spec.get("inputs", [])
+        if port.get("required", True) and port.get("default") is None
+        # Feedback ports get data from executor, not edges
+        and port["name"] not in skip_ports
+    )
+    _REQUIRED_PORTS[node_type] = (spec, ports)
+    return ports
+
+
+# Fingerprint -> issues of recently validated workflows. The UI re-validates
+# on every edit, mostly with an unchanged graph; oldest entries go first.
+_RESULT_CACHE: Dict[tuple, List[Dict[str, Any]]] = {}
+_RESULT_CACHE_SIZE = 32
+
+
+def _fingerprint(wf: WorkflowDefinition) -> tuple:
+    """Everything validation reads from a workflow, plus the registry state.
+
+    Positions and other params do not affect the result; only a LoopEnd's
+    pair_id does.
+    """
+    return (
+        get_registry_version(),
+        len(get_registry_view()),
+        tuple(
+            (n.id, n.type, n.parent_id, n.muted,
+             n.params.get("pair_id") if n.type == "loop_end" else None)
+            for n in wf.nodes
+        ),
+        tuple(
+            (e.source, e.source_port, e.target, e.target_port, e.is_back_edge)
+            for e in wf.edges
+        ),
+    )
 
 
 def validate_workflow(wf: WorkflowDefinition) -> List[Dict[str, Any]]:
@@ -23,50 +79,83 @@ def validate_workflow(wf: WorkflowDefinition) -> List[Dict[str, Any]]:
     5. Muted nodes (info note)
     6. LoopStart↔LoopEnd pairing (error if unpaired)
     7. loop_node without feedback back-edges (warning)
+
+    Results are memoized on a fingerprint of the workflow; callers get
+    fresh copies of the issue dicts.
     """
+    try:
+        key = _fingerprint(wf)
+        cached = _RESULT_CACHE.get(key)
+    except TypeError:  # unhashable pair_id: validate without caching
+        return _validate(wf)
+    if cached is None:
+        cached = _validate(wf)
+        if len(_RESULT_CACHE) >= _RESULT_CACHE_SIZE:
+            del _RESULT_CACHE[next(iter(_RESULT_CACHE))]
+        _RESULT_CACHE[key] = cached
+    return [dict(issue) for issue in cached]
+
+
+def _validate(wf: WorkflowDefinition) -> List[Dict[str, Any]]:
+    """Run the checks listed in validate_workflow."""
     issues: List[Dict[str, Any]] = []
 
     if not wf.nodes:
         return issues
 
-    # Build lookup sets for quick edge queries
-    incoming_ports: Dict[str, Set[str]] = {n.id: set() for n in wf.nodes}
-    has_edge: Dict[str, bool] = {n.id: False for n in wf.nodes}
+    # --- Edge pass: everything the checks need from edges ---
+    incoming_ports: Dict[str, Set[str]] = {}
+    connected: Set[str] = set()
+    back_edge_targets: Set[str] = set()
+    forward_edges: List[WorkflowEdge] = []
 
     for edge in wf.edges:
-        if edge.target in incoming_ports:
-            incoming_ports[edge.target].add(edge.target_port)
-        if edge.source in has_edge:
-            has_edge[edge.source] = True
-        if edge.target in has_edge:
-            has_edge[edge.target] = True
-
-    # --- Check 1: Unknown node type ---
+        ports = incoming_ports.get(edge.target)
+        if ports is None:
+            incoming_ports[edge.target] = {edge.target_port}
+        else:
+            ports.add(edge.target_port)
+        connected.add(edge.source)
+        connected.add(edge.target)
+        if edge.is_back_edge:
+            back_edge_targets.add(edge.target)  # intentional loop feedback, not a cycle
+        else:
+            forward_edges.append(edge)
+
+    # --- Node pass: checks 1, 2, 4, 5, 7 plus bookkeeping for 3 and 6 ---
+    # Issues are gathered per check and concatenated in check order below
+    unknown: List[Dict[str, Any]] = []
+    missing_inputs: List[Dict[str, Any]] = []
+    isolated: List[Dict[str, Any]] = []
+    muted: List[Dict[str, Any]] = []
+    no_feedback: List[Dict[str, Any]] = []
+
+    registry = get_registry_view()
+    check_isolated = len(wf.nodes) > 1
+    top_level_ids: Set[str] = set()
+    starts: List[str] = []
+    ends: List[Tuple[str, Any]] = []  # (LoopEnd id, its pair_id)
+
     for n in wf.nodes:
-        if n.type not in _NODE_REGISTRY and n.type not in _EXECUTOR_TYPES:
-            issues.append({
+        node_type = n.type
+        if n.parent_id is None:
+            top_level_ids.add(n.id)
+
+        # Check 1: Unknown node type
+        spec = registry.get(node_type)
+        if spec is None and node_type not in _EXECUTOR_TYPES:
+            unknown.append({
                 "level": "error",
                 "node_id": n.id,
-                "message": f"Unknown node type '{n.type}'",
+                "message": f"Unknown node type '{node_type}'",
             })
 
-    # --- Check 2: Missing required input connections ---
-    # Ports that receive data from loop feedback (not from edges)
-    _feedback_ports = {"loop_end": {"in_1", "in_2", "in_3"},
-                       "loop_node": {"feedback_1", "feedback_2", "feedback_3"}}
-
-    for n in wf.nodes:
-        spec = _NODE_REGISTRY.get(n.type)
-        if spec is None:
-            continue
-        skip_ports = _feedback_ports.get(n.type, set())
-        for port in spec.get("inputs", []):
-            if port.get("required", True) and port.get("default") is None:
-                port_name = port["name"]
-                if port_name in skip_ports:
-                    continue  # Feedback ports get data from executor, not edges
-                if port_name not in incoming_ports.get(n.id, set()):
-                    issues.append({
+        # Check 2: Missing required input connections
+        if spec is not None:
+            connected_ports = incoming_ports.get(n.id, _NO_PORTS)
+            for port_name in _required_ports(node_type, spec):
+                if port_name not in connected_ports:
+                    missing_inputs.append({
                         "level": "error",
                         "node_id": n.id,
                         "message": (
@@ -74,99 +163,118 @@ def validate_workflow(wf: WorkflowDefinition) -> List[Dict[str, Any]]:
                         ),
                     })
 
-    # --- Check 3: Cycle detection (DFS on top-level nodes, excluding back-edges) ---
-    top_level_ids = {n.id for n in wf.nodes if n.parent_id is None}
-    adjacency: Dict[str, List[str]] = {nid: [] for nid in top_level_ids}
-    for edge in wf.edges:
-        if edge.is_back_edge:
-            continue  # Back-edges are intentional loop feedback, not cycles
-        if edge.source in top_level_ids and edge.target in top_level_ids:
-            adjacency[edge.source].append(edge.target)
-
-    if _has_cycle(adjacency, top_level_ids):
-        issues.append({
-            "level": "error",
-            "node_id": None,
-            "message": "Workflow contains a cycle",
-        })
-
-    # --- Check 4: Isolated nodes ---
-    if len(wf.nodes) > 1:
-        _skip_isolated = {"loop_group", "loop_start", "loop_end", "loop_node"}
-        for n in wf.nodes:
-            if n.type in _skip_isolated:
-                continue
-            if not has_edge.get(n.id, False):
-                issues.append({
-                    "level": "warning",
-                    "node_id": n.id,
-                    "message": f"Node '{n.id}' is isolated (no connections)",
-                })
+        # Check 4: Isolated nodes
+        if check_isolated and node_type not in _SKIP_ISOLATED and n.id not in connected:
+            isolated.append({
+                "level": "warning",
+                "node_id": n.id,
+                "message": f"Node '{n.id}' is isolated (no connections)",
+            })
 
-    # --- Check 5: Muted nodes ---
-    for n in wf.nodes:
+        # Check 5: Muted nodes
         if n.muted:
-            issues.append({
+            muted.append({
                 "level": "info",
                 "node_id": n.id,
                 "message": f"Node '{n.id}' is muted and will be skipped during execution",
             })
 
+        # Check 6 bookkeeping, check 7: loop_node without feedback
+        if node_type == "loop_start":
+            starts.append(n.id)
+        elif node_type == "loop_end":
+            ends.append((n.id, n.params.get("pair_id")))
+        elif node_type == "loop_node" and n.id not in back_edge_targets:
+            no_feedback.append({
+                "level": "warning",
+                "node_id": n.id,
+                "message": "Loop node has no feedback back-edges (loop will repeat same data)",
+            })
+
+    issues.extend(unknown)
+    issues.extend(missing_inputs)
+
+    # --- Check 3: Cycle detection (DFS on top-level nodes, excluding back-edges) ---
+    # A workflow without forward edges between top-level nodes is acyclic:
+    # skip building the graph and the DFS altogether
+    if forward_edges:
+        # Top-level ids mapped to 0..n-1 so the DFS works on int lists
+        index = {nid: i for i, nid in enumerate(top_level_ids)}
+        adjacency: List[List[int]] = [[] for _ in index]
+        num_edges = 0
+        for edge in forward_edges:
+            source = index.get(edge.source)
+            target = index.get(edge.target)
+            if source is not None and target is not None:
+                adjacency[source].append(target)
+                num_edges += 1
+
+        if num_edges and _has_cycle(adjacency):
+            issues.append({
+                "level": "error",
+                "node_id": None,
+                "message": "Workflow contains a cycle",
+            })
+
+    issues.extend(isolated)
+    issues.extend(muted)
+
     # --- Check 6: LoopStart↔LoopEnd pairing ---
-    start_ids = {n.id for n in wf.nodes if n.type == "loop_start"}
-    end_nodes = [n for n in wf.nodes if n.type == "loop_end"]
+    start_ids = set(starts)
     paired_starts: Set[str] = set()
 
-    for n in end_nodes:
-        pid = n.params.get("pair_id")
+    for end_id, pid in ends:
         if not pid or pid not in start_ids:
             issues.append({
                 "level": "error",
-                "node_id": n.id,
+                "node_id": end_id,
                 "message": f"LoopEnd pair_id '{pid}' does not match any LoopStart",
             })
         else:
             paired_starts.add(pid)
 
-    for sid in start_ids:
-        if sid not in paired_starts:
-            issues.append({
-                "level": "error",
-                "node_id": sid,
-                "message": "LoopStart has no matching LoopEnd (set pair_id on LoopEnd)",
-            })
-
-    # --- Check 7: loop_node without feedback ---
-    back_edge_targets = {e.target for e in wf.edges if e.is_back_edge}
-    for n in wf.nodes:
-        if n.type == "loop_node" and n.id not in back_edge_targets:
-            issues.append({
-                "level": "warning",
-                "node_id": n.id,
-                "message": "Loop node has no feedback back-edges (loop will repeat same data)",
-            })
+    unpaired = start_ids - paired_starts
+    if unpaired:
+        # Reported in node order, not set order
+        for sid in starts:
+            if sid in unpaired:
+                issues.append({
+                    "level": "error",
+                    "node_id": sid,
+                    "message": "LoopStart has no matching LoopEnd (set pair_id on LoopEnd)",
+                })
 
+    issues.extend(no_feedback)
     return issues
 
 
-def _has_cycle(adjacency: Dict[str, List[str]], all_nodes: Set[str]) -> bool:
-    """Detect cycles using DFS with coloring."""
+def _has_cycle(adjacency: List[List[int]]) -> bool:
+    """Detect cycles using DFS with coloring.
+
+    ``adjacency[i]`` lists the successors of node i. Iterative, with an
+    explicit stack of (node, neighbor iterator): deep chains cannot hit the
+    recursion limit. Colors live in one bytearray indexed by node; the
+    search returns on the first back edge found.
+    """
     WHITE, GRAY, BLACK = 0, 1, 2
-    color: Dict[str, int] = {nid: WHITE for nid in all_nodes}
+    color = bytearray(len(adjacency))
 
-    def dfs(node: str) -> bool:
-        color[node] = GRAY
-        for neighbor in adjacency.get(node, []):
-            if color.get(neighbor) == GRAY:
-                return True
-            if color.get(neighbor) == WHITE:
-                if dfs(neighbor):
-                    return True
-        color[node] = BLACK
-        return False
-
-    for node in all_nodes:
-        if color[node] == WHITE:
-            if dfs(node):
+    for root in range(len(adjacency)):
+        if color[root] != WHITE:
+            continue
+        color[root] = GRAY
+        stack = [(root, iter(adjacency[root]))]
+        while stack:
+            node, neighbors = stack[-1]
+            neighbor = next(neighbors, -1)
+            if neighbor < 0:
+                color[node] = BLACK
+                stack.pop()
+                continue
+            state = color[neighbor]
+            if state == GRAY:
                 return True
+            if state == WHITE:
+                color[neighbor] = GRAY
+                stack.append((neighbor, iter(adjacency[neighbor])))
     return False
@@ -22,11 +22,13 @@ NODE_INFO = {
 
 
 def run(dist_matrix, tour):
-    n = len(tour)
-
-    edge_lengths = np.array([
-        dist_matrix[tour[i], tour[(i + 1) % n]] for i in range(n)
-    ])
+    tour = np.asarray(tour)
+    # Successor of each stop (wrapping to the start), gathered in one step
+    nxt = np.empty_like(tour)
+    nxt[:-1] = tour[1:]
+    nxt[-1] = tour[0]
+    # float64 so sums over float32 distance matrices don't lose digits
+    edge_lengths = dist_matrix[tour, nxt].astype(np.float64, copy=False)
     total = float(np.sum(edge_lengths))
     avg = float(np.mean(edge_lengths))
     longest = float(np.max(edge_lengths))
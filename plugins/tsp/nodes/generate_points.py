@@ -7,7 +7,7 @@ NODE_INFO = {
     "label": "Generate Points",
     "category": "INPUT",
     "description": "Generate random 2D points on a plane",
-    "doc": "Creates N random points with x,y coordinates in [0, 1000].",
+    "doc": "Creates N random float32 points with x,y coordinates in [0, 1000].",
     "ports_in": [{"name": "num_points", "type": "NUMBER", "default": 100}],
     "ports_out": [{"name": "points", "type": "ARRAY"}],
 }
@@ -15,6 +15,8 @@ NODE_INFO = {
 
 def run(num_points=100):
     n = int(num_points)
-    points = np.random.uniform(0, 1000, size=(n, 2))
+    # Global RNG, so np.random.seed still reproduces a run; stored as float32
+    # so every downstream node reads half the bytes
+    points = np.random.uniform(0, 1000, size=(n, 2)).astype(np.float32)
     logger.info(f"Generated {n} points in [0,1000]x[0,1000]")
     return points
@@ -1,5 +1,6 @@
 """TSP node: Nearest-neighbor greedy solver."""
 import numpy as np
+from numba import njit
 from pipestudio.plugin_api import logger
 
 NODE_INFO = {
@@ -16,25 +17,35 @@ NODE_INFO = {
 }
 
 
-def run(dist_matrix):
-    n = len(dist_matrix)
-
+@njit(cache=True)
+def _nearest_neighbor_tour(dist_matrix):
+    """Greedy tour from city 0: always step to the closest unvisited city."""
+    n = dist_matrix.shape[0]
     visited = np.zeros(n, dtype=np.bool_)
     tour = np.zeros(n, dtype=np.int64)
-    tour[0] = 0
     visited[0] = True
 
     for step in range(1, n):
-        current = tour[step - 1]
-        dists = dist_matrix[current].copy()
-        dists[visited] = np.inf
-        nearest = np.argmin(dists)
+        row = dist_matrix[tour[step - 1]]
+        nearest = -1
+        best = np.inf
+        for j in range(n):
+            # Strict < keeps the lowest index on ties, as argmin did
+            if not visited[j] and row[j] < best:
+                best = row[j]
+                nearest = j
         tour[step] = nearest
         visited[nearest] = True
+    return tour
+
+
+def run(dist_matrix):
+    n = len(dist_matrix)
+    tour = _nearest_neighbor_tour(np.ascontiguousarray(dist_matrix))
 
-    tour_length = 0.0
-    for i in range(n):
-        tour_length += dist_matrix[tour[i], tour[(i + 1) % n]]
+    # float64 sum of float32 edges
+    tour_length = dist_matrix[tour, np.roll(tour, -1)].sum(dtype=np.float64)
 
-    logger.info(f"Tour: {tour_length:.2f} ({n} cities)")
+    if logger.is_enabled_for("INFO"):
+        logger.info(f"Tour: {tour_length:.2f} ({n} cities)")
     return tour, float(tour_length)
@@ -1,4 +1,5 @@
 """TSP node: Log tour details on demand."""
+import numpy as np
 from pipestudio.plugin_api import logger
 
 NODE_INFO = {
@@ -20,17 +21,20 @@ NODE_INFO = {
 
 def run(tour, dist_matrix):
     n = len(tour)
+    stops = np.asarray(tour)
+    nxt = np.roll(stops, -1)
+    # All edge lengths in one gather, summed in float64
+    dists = dist_matrix[stops, nxt].astype(np.float64, copy=False)
+    total = float(dists.sum())
+    if not logger.is_enabled_for("INFO"):
+        return tour, total
 
-    edges = []
-    total = 0.0
-    for i in range(n):
-        a, b = int(tour[i]), int(tour[(i + 1) % n])
-        d = float(dist_matrix[a, b])
-        total += d
-        edges.append(f"  {a} -> {b}: {d:.1f}")
+    # Converted to Python ints/floats in bulk, not one NumPy scalar at a time
+    order = stops.tolist()
+    edges = [f"  {a} -> {b}: {d:.1f}" for a, b, d in zip(order, nxt.tolist(), dists.tolist())]
 
     logger.info(f"Tour ({n} cities, length={total:.2f}):")
-    logger.info(f"  Order: {' -> '.join(str(int(x)) for x in tour)} -> {int(tour[0])}")
+    logger.info(f"  Order: {' -> '.join(map(str, order))} -> {order[0]}")
 
     # Log edges in chunks to avoid huge single messages
     chunk = 20
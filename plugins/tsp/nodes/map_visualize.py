@@ -21,30 +21,30 @@ NODE_INFO = {
 
 def run(points, tour):
     n = len(tour)
+    points = np.asarray(points)
+    # x and y as separate contiguous columns: unit-stride gathers below
+    xs = np.ascontiguousarray(points[:, 0], dtype=np.float64)
+    ys = np.ascontiguousarray(points[:, 1], dtype=np.float64)
+    stops = np.asarray(tour)
+    nxt = np.roll(stops, -1)
+    start = int(stops[0])
 
-    # Compute tour length
-    total = 0.0
-    for i in range(n):
-        a, b = int(tour[i]), int(tour[(i + 1) % n])
-        dx = points[a, 0] - points[b, 0]
-        dy = points[a, 1] - points[b, 1]
-        total += float(np.sqrt(dx * dx + dy * dy))
+    # Compute tour length in one vectorized pass over the stops
+    total = float(np.hypot(xs[nxt] - xs[stops], ys[nxt] - ys[stops]).sum())
 
     # Normalize points to SVG viewport
     W, H = 600, 600
     PAD = 30
-    xs = points[:, 0]
-    ys = points[:, 1]
     x_min, x_max = float(xs.min()), float(xs.max())
     y_min, y_max = float(ys.min()), float(ys.max())
     x_range = x_max - x_min or 1.0
     y_range = y_max - y_min or 1.0
-
-    def tx(x):
-        return PAD + (x - x_min) / x_range * (W - 2 * PAD)
-
-    def ty(y):
-        return PAD + (y - y_min) / y_range * (H - 2 * PAD)
+    # Viewport coordinates of every point, transformed in one pass
+    px = (PAD + (xs - x_min) / x_range * (W - 2 * PAD)).tolist()
+    py = (PAD + (ys - y_min) / y_range * (H - 2 * PAD)).tolist()
+    # Each coordinate formatted once, shared by the path and the circles
+    fx = [f"{x:.1f}" for x in px]
+    fy = [f"{y:.1f}" for y in py]
 
     # Build SVG
     lines = [
@@ -53,31 +53,26 @@ def run(points, tour):
     ]
 
     # Tour path
-    path_points = []
-    for i in range(n):
-        idx = int(tour[i])
-        path_points.append(f"{tx(points[idx, 0]):.1f},{ty(points[idx, 1]):.1f}")
-    # Close the loop
-    idx0 = int(tour[0])
-    path_points.append(f"{tx(points[idx0, 0]):.1f},{ty(points[idx0, 1]):.1f}")
+    order = stops.tolist()
+    order.append(start)  # Close the loop
+    path_points = " ".join([fx[idx] + "," + fy[idx] for idx in order])
     lines.append(
-        f'  <polyline points="{" ".join(path_points)}" '
+        f'  <polyline points="{path_points}" '
         f'fill="none" stroke="#3b82f6" stroke-width="1.5" opacity="0.7"/>'
     )
 
     # Points
-    for i in range(len(points)):
-        cx = tx(points[i, 0])
-        cy = ty(points[i, 1])
-        color = "#ef4444" if i == int(tour[0]) else "#10b981"
-        r = "4" if i == int(tour[0]) else "2.5"
-        lines.append(
-            f'  <circle cx="{cx:.1f}" cy="{cy:.1f}" r="{r}" fill="{color}"/>'
-        )
+    circles = [
+        f'  <circle cx="{cx}" cy="{cy}" r="2.5" fill="#10b981"/>'
+        for cx, cy in zip(fx, fy)
+    ]
+    # The start city is drawn larger, in red
+    circles[start] = f'  <circle cx="{fx[start]}" cy="{fy[start]}" r="4" fill="#ef4444"/>'
+    lines.extend(circles)
 
     # Start label
-    sx = tx(points[int(tour[0]), 0])
-    sy = ty(points[int(tour[0]), 1])
+    sx = px[start]
+    sy = py[start]
     lines.append(
         f'  <text x="{sx + 6:.1f}" y="{sy - 6:.1f}" '
         f'fill="#ef4444" font-size="11" font-family="monospace">start</text>'
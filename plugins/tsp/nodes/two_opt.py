@@ -1,5 +1,6 @@
 """TSP node: 2-opt local search improvement."""
 import numpy as np
+from numba import njit
 from pipestudio.plugin_api import logger
 
 NODE_INFO = {
@@ -20,35 +21,133 @@ NODE_INFO = {
     ],
 }
 
+# Candidate partners per city for a 2-opt move: improving moves almost
+# always reconnect cities that are close to each other
+NUM_NEIGHBORS = 20
 
-def run(dist_matrix, tour, max_iterations=100):
-    tour = tour.copy()
-    max_iter = int(max_iterations)
-    n = len(tour)
 
-    def tour_length(t):
-        length = 0.0
-        for i in range(n):
-            length += dist_matrix[t[i], t[(i + 1) % n]]
-        return length
+def _neighbor_lists(dist_matrix, k):
+    """(n, k+1) indices of each city's nearest cities, closest first.
+
+    Usually includes the city itself (distance 0); the kernel skips it.
+    """
+    n = dist_matrix.shape[0]
+    k = min(k + 1, n)
+    if k < n:
+        nearest = np.argpartition(dist_matrix, k - 1, axis=1)[:, :k]
+    else:
+        nearest = np.broadcast_to(np.arange(n), (n, n))
+    order = np.argsort(np.take_along_axis(dist_matrix, nearest, axis=1), axis=1, kind="stable")
+    return np.ascontiguousarray(np.take_along_axis(nearest, order, axis=1), dtype=np.int64)
+
+
+@njit(cache=True)
+def _two_opt_kernel(dist_matrix, neighbors, tour, max_iter):
+    """First-improvement 2-opt with don't-look bits, editing ``tour`` in place.
+
+    ``tour`` must be a permutation of range(len(dist_matrix)): ``pos`` and
+    the don't-look bits are indexed by city without bounds checks.
 
-    initial_length = tour_length(tour)
+    For each edge of a city only its ``neighbors`` are tried as the new
+    partner, nearest first, stopping once a candidate is farther away than
+    the edge it would replace. A city's don't-look bit is set once none of
+    its edges take part in an improving move, and cleared when a move
+    touches one of its edges; sweeps only scan cities whose bit is clear.
+    Returns (initial length, final length, sweeps run).
+    """
+    n = tour.shape[0]
+    initial_length = 0.0  # float64 sum of float32 edges
+    for i in range(n):
+        initial_length += dist_matrix[tour[i - 1], tour[i]]
     best_length = initial_length
 
-    for iteration in range(max_iter):
+    pos = np.empty(n, dtype=np.int64)  # city -> index in tour
+    for i in range(n):
+        pos[tour[i]] = i
+    dont_look = np.zeros(n, dtype=np.uint8)
+
+    iterations = 0
+    for _ in range(max_iter):
+        iterations += 1
         improved = False
-        for i in range(1, n - 1):
-            for j in range(i + 1, n):
-                d1 = dist_matrix[tour[i - 1], tour[i]] + dist_matrix[tour[j], tour[(j + 1) % n]]
-                d2 = dist_matrix[tour[i - 1], tour[j]] + dist_matrix[tour[i], tour[(j + 1) % n]]
-                if d2 < d1 - 1e-10:
-                    tour[i:j + 1] = tour[i:j + 1][::-1]
-                    best_length -= (d1 - d2)
-                    improved = True
+        for city in range(n):
+            if dont_look[city]:
+                continue
+            # Keep improving around this city until its edges are settled
+            found = True
+            while found:
+                found = False
+                # Edge e joins tour[e] and its successor. For the city's
+                # outgoing edge the partner's outgoing edge is replaced, for
+                # its incoming edge the partner's incoming one
+                for side in range(2):
+                    if side == 0:
+                        e = pos[city]
+                        other = tour[e + 1] if e + 1 < n else tour[0]  # successor
+                    else:
+                        e = pos[city] - 1 if pos[city] > 0 else n - 1
+                        other = tour[e]  # predecessor
+                    limit = dist_matrix[city, other]
+                    for t in range(neighbors.shape[1]):
+                        partner = neighbors[city, t]
+                        if partner == city:
+                            continue
+                        if dist_matrix[city, partner] >= limit:
+                            break
+                        f = pos[partner] if side == 0 else pos[partner] - 1
+                        if f < 0:
+                            f = n - 1
+                        if f == e:
+                            continue
+                        p, q = (e, f) if e < f else (f, e)
+                        a, b = tour[p], tour[p + 1]
+                        c = tour[q]
+                        d = tour[q + 1] if q + 1 < n else tour[0]
+                        # Compared as two sums so a move and its undo can't
+                        # both look improving under rounding
+                        d1 = np.float64(dist_matrix[a, b]) + dist_matrix[c, d]
+                        d2 = np.float64(dist_matrix[a, c]) + dist_matrix[b, d]
+                        if d2 < d1 - 1e-10:
+                            # Reverse tour[p+1..q] by swapping, no temporary slice
+                            lo, hi = p + 1, q
+                            while lo < hi:
+                                tour[lo], tour[hi] = tour[hi], tour[lo]
+                                pos[tour[lo]] = lo
+                                pos[tour[hi]] = hi
+                                lo += 1
+                                hi -= 1
+                            dont_look[a] = 0
+                            dont_look[b] = 0
+                            dont_look[c] = 0
+                            dont_look[d] = 0
+                            best_length -= d1 - d2
+                            improved = True
+                            found = True
+                            break
+                    if found:
+                        break
+            dont_look[city] = 1
         if not improved:
             break
+    return initial_length, best_length, iterations
+
+
+def run(dist_matrix, tour, max_iterations=100):
+    tour = np.array(tour, dtype=np.int64)
+    dist_matrix = np.asarray(dist_matrix)
+    # The kernel indexes its bookkeeping by city, so it needs a tour over
+    # every city exactly once; a subtour is solved on its own sub-matrix
+    full = len(tour) == len(dist_matrix) and np.array_equal(
+        np.sort(tour), np.arange(len(dist_matrix)))
+    sub_matrix = np.ascontiguousarray(dist_matrix if full else dist_matrix[np.ix_(tour, tour)])
+    order = tour if full else np.arange(len(tour), dtype=np.int64)
+    initial_length, best_length, iterations = _two_opt_kernel(
+        sub_matrix, _neighbor_lists(sub_matrix, NUM_NEIGHBORS), order, int(max_iterations))
+    if not full:
+        tour = tour[order]
 
     improvement = initial_length - best_length
-    pct = (improvement / initial_length) * 100 if initial_length > 0 else 0
-    logger.info(f"{initial_length:.2f} -> {best_length:.2f} (-{pct:.1f}%, {iteration + 1} iters)")
+    if logger.is_enabled_for("INFO"):
+        pct = (improvement / initial_length) * 100 if initial_length > 0 else 0
+        logger.info(f"{initial_length:.2f} -> {best_length:.2f} (-{pct:.1f}%, {iterations} iters)")
     return tour, float(best_length), float(improvement)
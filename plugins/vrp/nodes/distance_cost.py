@@ -14,6 +14,7 @@ NODE_INFO = {
     "ports_out": [
         {"name": "bundle", "type": "ARRAY"},
     ],
+    "pure": True,
 }
 
 X_COL, Y_COL = 0, 1
@@ -14,6 +14,7 @@ NODE_INFO = {
     "ports_out": [
         {"name": "bundle", "type": "ARRAY"},
     ],
+    "pure": True,
 }
 
 DEMAND_COL = 2  # column index in customers array
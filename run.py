@@ -4,6 +4,35 @@ import sys
 import threading
 import webbrowser
 
+# Event loop for the backend: "auto" (uvloop when installed), "uvloop",
+# "uringcore" (io_uring, Linux 5.11+) or "default" (plain asyncio)
+LOOP_ENV = "PIPESTUDIO_LOOP"
+
+
+def uringcore_loop_factory():
+    """uvicorn loop factory backed by uringcore's io_uring event loop.
+
+    uvicorn calls a custom ``loop`` import string with no arguments and
+    expects a new event loop back.
+    """
+    import uringcore
+    return uringcore.EventLoopPolicy().new_event_loop()
+
+
+def _select_loop():
+    """Map PIPESTUDIO_LOOP to a uvicorn ``loop`` setting, falling back to asyncio."""
+    choice = os.environ.get(LOOP_ENV, "auto").lower()
+    if choice == "default":
+        return "asyncio"
+    if choice in ("uvloop", "uringcore"):
+        try:
+            __import__(choice)
+        except ImportError:
+            print(f"  {LOOP_ENV}={choice} requested but not installed, using asyncio")
+            return "asyncio"
+        return "uvloop" if choice == "uvloop" else "run:uringcore_loop_factory"
+    return "auto"
+
 
 def main():
     root = os.path.dirname(os.path.abspath(__file__))
@@ -24,7 +53,8 @@ def main():
     print("  API Docs: http://localhost:8500/docs")
     print("=" * 50)
 
-    uvicorn.run("pipestudio.server:app", host="127.0.0.1", port=8500, reload=True)
+    uvicorn.run("pipestudio.server:app", host="127.0.0.1", port=8500, reload=True,
+                loop=_select_loop())
 
 
 if __name__ == "__main__":
@@ -168,6 +168,104 @@ def test_logger_captures_entries():
     assert "message" in entry
 
 
+def test_loop_logs_are_batched():
+    """Logs inside loop iterations arrive as log_batch events, not one event each."""
+    _load()
+    events = []
+
+    def handler(event_type, data):
+        events.append((event_type, data))
+
+    wf = WorkflowDefinition(
+        name="test_log_batch",
+        nodes=[
+            WorkflowNode(id="gen", type="tsp_generate_points", params={"num_points": 5}),
+            WorkflowNode(id="ls", type="loop_start", params={"iterations": 20}),
+            WorkflowNode(id="dm", type="tsp_distance_matrix"),
+            WorkflowNode(id="le", type="loop_end", params={"pair_id": "ls"}),
+        ],
+        edges=[
+            WorkflowEdge(id="e1", source="gen", source_port="points",
+                         target="ls", target_port="in_1"),
+            WorkflowEdge(id="e2", source="ls", source_port="out_1",
+                         target="dm", target_port="points"),
+            WorkflowEdge(id="e3", source="ls", source_port="out_1",
+                         target="le", target_port="in_1"),
+        ],
+    )
+    WorkflowExecutor(wf, event_handler=handler, verbose=False).execute()
+
+    single = [d for t, d in events if t == "log"]
+    assert all(d["node_id"] == "gen" for d in single)
+    batched = [entry for t, d in events if t == "log_batch" for entry in d["entries"]]
+    assert len([e for e in batched if e["node_id"] == "dm"]) == 20
+    assert any(e["message"] == "Iteration 20/20" for e in batched)
+
+
+def test_pure_body_node_reuses_result_for_same_inputs():
+    """A pure loop body node runs once while its inputs stay the same objects."""
+    _load()
+    calls = []
+
+    def counting_matrix(params, points=None):
+        calls.append(points)
+        return {"dist_matrix": np.zeros((len(points), len(points)))}
+    counting_matrix.pure = True
+
+    events = []
+    wf = WorkflowDefinition(
+        name="test_pure_memo",
+        nodes=[
+            WorkflowNode(id="gen", type="tsp_generate_points", params={"num_points": 5}),
+            WorkflowNode(id="ls", type="loop_start", params={"iterations": 5}),
+            WorkflowNode(id="dm", type="tsp_distance_matrix"),
+            WorkflowNode(id="le", type="loop_end", params={"pair_id": "ls"}),
+        ],
+        edges=[
+            WorkflowEdge(id="e1", source="gen", source_port="points",
+                         target="ls", target_port="in_1"),
+            WorkflowEdge(id="e2", source="ls", source_port="out_1",
+                         target="dm", target_port="points"),
+            WorkflowEdge(id="e3", source="ls", source_port="out_1",
+                         target="le", target_port="in_1"),
+        ],
+    )
+    executor = WorkflowExecutor(wf, event_handler=lambda t, d: events.append((t, d)),
+                                verbose=False)
+    executor.executors["tsp_distance_matrix"] = counting_matrix
+    executor.execute()
+
+    assert len(calls) == 1
+    summary = [d for t, d in events if t == "profiler_summary"][0]
+    assert summary["memo_hits"] == {"dm": 4}
+
+
+def test_summarize_data_types():
+    """Breakpoint summaries cover arrays, scalars, containers and callables."""
+    executor = WorkflowExecutor(WorkflowDefinition(name="test_summary"))
+    array_ref = {"_type": "array", "length": 3}
+    summary = executor._summarize_data({
+        "arr": np.zeros((4, 2)),
+        "num": 3,
+        "flt": np.float64(1.5),
+        "text": "hi",
+        "ref": array_ref,
+        "cfg": {"a": 1},
+        "items": (1, 2, 3),
+        "fn": len,
+        "none": None,
+    })
+    assert summary["arr"] == {"_type": "array", "shape": (4, 2), "dtype": "float64", "length": 4}
+    assert summary["num"] == 3
+    assert summary["flt"] == 1.5
+    assert summary["text"] == "hi"
+    assert summary["ref"] is array_ref
+    assert summary["cfg"] == {"_type": "dict"}
+    assert summary["items"] == {"_type": "list", "length": 3}
+    assert summary["fn"] == {"_type": "function", "name": "len"}
+    assert summary["none"] == {"_type": "NoneType"}
+
+
 def test_muted_node_passes_through():
     """Muted node passes inputs through without executing."""
     _load()
@@ -266,6 +364,185 @@ def test_comfyui_loop_two_channels():
     assert "out_2" in results["le"]
 
 
+def _parallel_body_workflow(body_type="tsp_distance_matrix"):
+    return WorkflowDefinition(
+        name="test_parallel_body",
+        nodes=[
+            WorkflowNode(id="gen", type="tsp_generate_points", params={"num_points": 6}),
+            WorkflowNode(id="ls", type="loop_start", params={"iterations": 3}),
+            WorkflowNode(id="dm1", type=body_type),
+            WorkflowNode(id="dm2", type=body_type),
+            WorkflowNode(id="le", type="loop_end", params={"pair_id": "ls"}),
+        ],
+        edges=[
+            WorkflowEdge(id="e1", source="gen", source_port="points",
+                         target="ls", target_port="in_1"),
+            WorkflowEdge(id="e2", source="ls", source_port="out_1",
+                         target="dm1", target_port="points"),
+            WorkflowEdge(id="e3", source="ls", source_port="out_1",
+                         target="dm2", target_port="points"),
+            WorkflowEdge(id="e4", source="dm1", source_port="dist_matrix",
+                         target="le", target_port="in_1"),
+            WorkflowEdge(id="e5", source="dm2", source_port="dist_matrix",
+                         target="le", target_port="in_2"),
+        ],
+    )
+
+
+def test_loop_body_level_runs_in_parallel():
+    """Independent body nodes of one level run as a pooled step and log under their own id."""
+    _load()
+    events = []
+    executor = WorkflowExecutor(_parallel_body_workflow(), max_workers=2, verbose=False,
+                                event_handler=lambda t, d: events.append((t, d)))
+    levels = executor._topological_levels(
+        [executor.nodes_by_id[n] for n in ("ls", "dm1", "dm2", "le")], executor._forward_edges)
+    assert sorted(levels[1]) == ["dm1", "dm2"]
+    steps = executor._body_steps(levels, skip="ls")
+    assert sorted(steps[0]) == ["dm1", "dm2"]
+
+    results = executor.execute()
+    assert results["le"]["out_1"].shape == (6, 6)
+    assert np.array_equal(results["le"]["out_1"], results["le"]["out_2"])
+    entries = [e for t, d in events if t == "log_batch" for e in d["entries"]]
+    assert len([e for e in entries if e["node_id"] == "dm1"]) == 3
+    assert len([e for e in entries if e["node_id"] == "dm2"]) == 3
+
+
+def test_parallel_body_logs_carry_worker_node_id():
+    """Log lines written on pool threads are tagged with the node that wrote them."""
+    import threading
+    from pipestudio.plugin_api import logger
+    _load()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def tagged_matrix(params, points=None):
+        barrier.wait()  # both body nodes log while running concurrently
+        logger.info(f"from {params['tag']}")
+        return {"dist_matrix": np.zeros((len(points), len(points)))}
+    tagged_matrix.parallel_safe = True
+
+    events = []
+    executor = WorkflowExecutor(_parallel_body_workflow(), max_workers=2, verbose=False,
+                                event_handler=lambda t, d: events.append((t, d)))
+    executor.executors["tsp_distance_matrix"] = tagged_matrix
+    for nid in ("dm1", "dm2"):
+        executor.nodes_by_id[nid].params = {"tag": nid}
+    executor.execute()
+
+    entries = [e for t, d in events if t == "log_batch" for e in d["entries"]
+               if e["message"].startswith("from ")]
+    assert len(entries) == 6
+    assert all(e["message"] == f"from {e['node_id']}" for e in entries)
+
+
+def test_nodes_without_parallel_safe_run_inline():
+    """Nodes whose NODE_INFO does not opt in to parallel execution run as inline steps."""
+    _load()
+    executor = WorkflowExecutor(_parallel_body_workflow("tsp_evaluate"), max_workers=4)
+    steps = executor._body_steps([["ls"], ["dm1", "dm2"], ["le"]], skip="ls")
+    assert all(isinstance(step, str) for step in steps)
+
+
+def test_logger_context_is_per_thread():
+    """Nodes logging from different threads keep their own node context."""
+    import threading
+    from pipestudio.plugin_api import logger
+
+    records = []
+    barrier = threading.Barrier(2)
+
+    def handler(level, node_id, node_type, message):
+        records.append((node_id, message))
+
+    def work(nid):
+        token = logger._set_context(nid, "test", handler)
+        try:
+            barrier.wait()  # both contexts are set before either logs
+            logger.info(nid)
+        finally:
+            logger._clear_context(token)
+
+    threads = [threading.Thread(target=work, args=(nid,)) for nid in ("a", "b")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(records) == [("a", "a"), ("b", "b")]
+
+
+def test_logger_level_filters_messages():
+    """Messages below the context's level are dropped and is_enabled_for reports it."""
+    from pipestudio.plugin_api import logger
+
+    records = []
+    token = logger._set_context("n", "test", lambda level, *rest: records.append(level), "WARN")
+    try:
+        assert not logger.is_enabled_for("INFO")
+        assert logger.is_enabled_for("ERROR")
+        logger.info("dropped")
+        logger.warn("kept")
+    finally:
+        logger._clear_context(token)
+    assert records == ["WARN"]
+
+
+def test_executor_log_level_applies_per_run():
+    """log_level=WARN on one executor suppresses plugin INFO logs for that run only."""
+    _load()
+    def run(log_level):
+        events = []
+        wf = WorkflowDefinition(
+            name="test",
+            nodes=[WorkflowNode(id="gen", type="tsp_generate_points", params={"num_points": 10})],
+            edges=[],
+        )
+        WorkflowExecutor(wf, event_handler=lambda t, d: events.append(t),
+                         verbose=False, log_level=log_level).execute()
+        return events
+
+    assert "log" not in run("WARN")
+    assert "log" in run(None)
+
+
+def test_topological_sort_cached_across_executors():
+    """A second executor on the same graph reuses the cached topological order."""
+    from pipestudio.executor import _topo_order
+
+    wf = _parallel_body_workflow()
+    first = WorkflowExecutor(wf)._topological_sort(wf.nodes, wf.edges)
+    hits = _topo_order.cache_info().hits
+    second = WorkflowExecutor(wf)._topological_sort(wf.nodes, wf.edges)
+    assert second == first
+    assert _topo_order.cache_info().hits == hits + 1
+    assert first.index("ls") < first.index("dm1") < first.index("le")
+
+
+def test_find_loop_body_is_memoized():
+    """Loop body lookup is computed once per (start, end) pair."""
+    wf = WorkflowDefinition(
+        name="test_body_cache",
+        nodes=[
+            WorkflowNode(id="ls", type="loop_start"),
+            WorkflowNode(id="dm", type="tsp_distance_matrix"),
+            WorkflowNode(id="le", type="loop_end", params={"pair_id": "ls"}),
+            WorkflowNode(id="after", type="tsp_greedy"),
+        ],
+        edges=[
+            WorkflowEdge(id="e1", source="ls", source_port="out_1",
+                         target="dm", target_port="points"),
+            WorkflowEdge(id="e2", source="dm", source_port="dist_matrix",
+                         target="le", target_port="in_1"),
+            WorkflowEdge(id="e3", source="le", source_port="out_1",
+                         target="after", target_port="dist_matrix"),
+        ],
+    )
+    executor = WorkflowExecutor(wf)
+    body = executor._find_loop_body("ls", "le")
+    assert body == {"ls", "dm", "le"}
+    assert executor._find_loop_body("ls", "le") is body
+
+
 # ------------------------------------------------------------------
 # n8n style loop (loop_node with back-edge feedback)
 # ------------------------------------------------------------------
@@ -344,6 +344,155 @@ def run():
         shutil.rmtree(tmp_dir)
 
 
+def test_deactivate_unregisters_only_owned_nodes():
+    """deactivate_plugin removes that plugin's nodes without reloading the others."""
+    from pipestudio.plugin_loader import deactivate_plugin, load_plugins
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        project_dir = os.path.join(tmp_dir, "own_test")
+        os.makedirs(os.path.join(project_dir, "nodes"))
+        with open(os.path.join(project_dir, "manifest.json"), "w") as f:
+            json.dump({"name": "own_test", "version": "1.0.0", "categories": {}}, f)
+        for name in ("keep_node", "drop_node"):
+            with open(os.path.join(project_dir, "nodes", f"{name}.py"), "w") as f:
+                f.write(f'NODE_INFO = {{"type": "{name}", "ports_in": [], '
+                        f'"ports_out": [{{"name": "out"}}]}}\n\ndef run():\n    return 1\n')
+
+        _NODE_REGISTRY.clear()
+        _EXECUTORS.clear()
+        load_plugins(tmp_dir)
+        kept = _EXECUTORS["keep_node"]
+
+        deactivate_plugin(tmp_dir, "own_test/drop_node")
+        assert "drop_node" not in _NODE_REGISTRY
+        assert _EXECUTORS["keep_node"] is kept
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_deactivate_keeps_type_also_registered_by_another_plugin():
+    """A node type two plugins register survives deactivating one of them."""
+    import warnings
+    import pytest
+    from pipestudio.plugin_loader import deactivate_plugin, load_plugins
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        project_dir = os.path.join(tmp_dir, "dup_test")
+        os.makedirs(os.path.join(project_dir, "nodes"))
+        with open(os.path.join(project_dir, "manifest.json"), "w") as f:
+            json.dump({"name": "dup_test", "version": "1.0.0", "categories": {}}, f)
+        for name, label in (("first", "First"), ("second", "Second")):
+            with open(os.path.join(project_dir, "nodes", f"{name}.py"), "w") as f:
+                f.write(f'NODE_INFO = {{"type": "shared_node", "label": "{label}", '
+                        f'"ports_in": [], "ports_out": [{{"name": "out"}}]}}\n\n'
+                        f'def run():\n    return "{name}"\n')
+
+        _NODE_REGISTRY.clear()
+        _EXECUTORS.clear()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            load_plugins(tmp_dir)
+            assert _NODE_REGISTRY["shared_node"]["label"] == "Second"
+
+            deactivate_plugin(tmp_dir, "dup_test/second")
+        assert _NODE_REGISTRY["shared_node"]["label"] == "First"
+        assert "shared_node" in _EXECUTORS
+
+        with pytest.raises(ValueError):
+            deactivate_plugin(tmp_dir, "no_slash")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_load_project_reloads_only_that_project():
+    """load_project refreshes one project and leaves the others registered as-is."""
+    from pipestudio.plugin_loader import load_plugins, load_project
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        for project, node in (("proj_a", "a_node"), ("proj_b", "b_node")):
+            project_dir = os.path.join(tmp_dir, project)
+            os.makedirs(os.path.join(project_dir, "nodes"))
+            with open(os.path.join(project_dir, "manifest.json"), "w") as f:
+                json.dump({"name": project, "version": "1.0.0", "categories": {}}, f)
+            with open(os.path.join(project_dir, "nodes", f"{node}.py"), "w") as f:
+                f.write(f'NODE_INFO = {{"type": "{node}", "ports_in": [], '
+                        f'"ports_out": [{{"name": "out"}}]}}\n\ndef run():\n    return 1\n')
+
+        _NODE_REGISTRY.clear()
+        _EXECUTORS.clear()
+        load_plugins(tmp_dir)
+        kept = _EXECUTORS["b_node"]
+
+        os.remove(os.path.join(tmp_dir, "proj_a", "nodes", "a_node.py"))
+        manifest = load_project(tmp_dir, "proj_a")
+        assert manifest["_node_types"] == []
+        assert "a_node" not in _NODE_REGISTRY
+        assert _EXECUTORS["b_node"] is kept
+
+        shutil.rmtree(os.path.join(tmp_dir, "proj_b"))
+        assert load_project(tmp_dir, "proj_b") is None
+        assert "b_node" not in _NODE_REGISTRY
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_unchanged_project_reload_skips_imports():
+    """Reloading an unchanged project replays its nodes without re-importing."""
+    from pipestudio.plugin_loader import reload_plugins
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        project_dir = os.path.join(tmp_dir, "cache_test")
+        os.makedirs(os.path.join(project_dir, "nodes"))
+        with open(os.path.join(project_dir, "manifest.json"), "w") as f:
+            json.dump({"name": "cache_test", "version": "1.0.0", "categories": {}}, f)
+        counter_file = os.path.join(tmp_dir, "imports.count")
+        node_path = os.path.join(project_dir, "nodes", "cached_node.py")
+        node_code = f'''
+with open(r"{counter_file}", "a") as f:
+    f.write("x")
+
+NODE_INFO = {{"type": "cached_node", "ports_in": [], "ports_out": [{{"name": "out"}}]}}
+
+def run():
+    return 1
+'''
+        with open(node_path, "w") as f:
+            f.write(node_code)
+
+        reload_plugins(tmp_dir)
+        manifests = reload_plugins(tmp_dir)
+        assert "cached_node" in _EXECUTORS
+        assert manifests[0]["_node_types"] == ["cached_node"]
+        with open(counter_file) as f:
+            assert f.read() == "x"
+
+        with open(node_path, "w") as f:
+            f.write(node_code + "\n# changed\n")
+        reload_plugins(tmp_dir)
+        with open(counter_file) as f:
+            assert f.read() == "xx"
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_state_file_cache_tracks_writes():
+    """Cached plugins_state.json reads see every write and can't be mutated by callers."""
+    from pipestudio.plugin_loader import _read_state_file, _write_state_file
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        _write_state_file(tmp_dir, {"p/a": "inactive"})
+        state = _read_state_file(tmp_dir)
+        assert state == {"p/a": "inactive"}
+
+        state.pop("p/a")
+        assert _read_state_file(tmp_dir) == {"p/a": "inactive"}
+
+        _write_state_file(tmp_dir, {"p/b": "inactive"})
+        assert _read_state_file(tmp_dir) == {"p/b": "inactive"}
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
 def test_delete_requires_inactive():
     """delete_plugin raises error if plugin is still active."""
     from pipestudio.plugin_loader import delete_plugin
@@ -507,6 +656,55 @@ def on_activate():
         shutil.rmtree(tmp_dir)
 
 
+def test_hooks_module_cached_until_file_changes():
+    """hooks.py is executed once per version of the file, not once per hook call."""
+    from pipestudio.hooks import run_hook
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        counter_file = os.path.join(tmp_dir, "imports.count")
+        hooks_path = os.path.join(tmp_dir, "hooks.py")
+        hooks_code = f'''
+with open(r"{counter_file}", "a") as f:
+    f.write("x")
+
+def on_activate():
+    pass
+'''
+        with open(hooks_path, "w") as f:
+            f.write(hooks_code)
+
+        run_hook(tmp_dir, "on_activate")
+        run_hook(tmp_dir, "on_deactivate")
+        with open(counter_file) as f:
+            assert f.read() == "x"
+
+        with open(hooks_path, "w") as f:
+            f.write(hooks_code + "\n# changed\n")
+        run_hook(tmp_dir, "on_activate")
+        with open(counter_file) as f:
+            assert f.read() == "xx"
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_plugin_code_compiled_once_per_file_version():
+    """Reloading an unchanged plugin file reuses its code object."""
+    from pipestudio.plugin_loader import _compiled_source
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp_dir, "node.py")
+        with open(path, "w") as f:
+            f.write("VALUE = 1\n")
+        first = _compiled_source(path)
+        assert _compiled_source(path) is first
+
+        with open(path, "w") as f:
+            f.write("VALUE = 22\n")
+        assert _compiled_source(path) is not first
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
 # ------------------------------------------------------------------
 # Executor: NodeUnavailableError instead of KeyError
 # ------------------------------------------------------------------
@@ -559,3 +757,32 @@ def test_executor_runs_nodes_before_stuck_point():
     # gen should have run successfully
     assert "gen" in executor.node_outputs
     assert "points" in executor.node_outputs["gen"]
+
+
+def test_executor_raises_unavailable_inside_loop_body():
+    """A missing node type inside a ComfyUI loop body raises NodeUnavailableError."""
+    _fresh_load()
+    wf = WorkflowDefinition(
+        name="test_missing_in_loop",
+        nodes=[
+            WorkflowNode(id="gen", type="tsp_generate_points", params={"num_points": 5}),
+            WorkflowNode(id="ls", type="loop_start", params={"iterations": 2}),
+            WorkflowNode(id="bad", type="nonexistent_node_xyz"),
+            WorkflowNode(id="le", type="loop_end", params={"pair_id": "ls"}),
+        ],
+        edges=[
+            WorkflowEdge(id="e1", source="gen", source_port="points",
+                         target="ls", target_port="in_1"),
+            WorkflowEdge(id="e2", source="ls", source_port="out_1",
+                         target="bad", target_port="input"),
+            WorkflowEdge(id="e3", source="bad", source_port="output",
+                         target="le", target_port="in_1"),
+        ],
+    )
+    executor = WorkflowExecutor(wf)
+    try:
+        executor.execute()
+        assert False, "Should have raised NodeUnavailableError"
+    except NodeUnavailableError as e:
+        assert e.node_id == "bad"
+        assert e.node_type == "nonexistent_node_xyz"
@@ -50,10 +50,38 @@ def test_all_non_control_nodes_have_executors():
 
 
 def test_generate_points_executor():
+    import numpy as np
     _fresh_load()
     result = _EXECUTORS["tsp_generate_points"]({"num_points": 20})
     assert "points" in result
     assert result["points"].shape == (20, 2)
+    assert result["points"].dtype == np.float32
+    assert ((result["points"] >= 0) & (result["points"] <= 1000)).all()
+
+
+def test_generate_points_follows_numpy_seed():
+    import numpy as np
+    _fresh_load()
+    np.random.seed(7)
+    first = _EXECUTORS["tsp_generate_points"]({"num_points": 20})["points"]
+    np.random.seed(7)
+    second = _EXECUTORS["tsp_generate_points"]({"num_points": 20})["points"]
+    assert np.array_equal(first, second)
+
+
+def test_distance_matrix_executor():
+    import numpy as np
+    _fresh_load()
+    points = np.random.default_rng(0).uniform(0, 1000, size=(50, 2))
+    diff = points[:, np.newaxis, :] - points[np.newaxis, :, :]
+    expected = np.sqrt(np.sum(diff ** 2, axis=2))
+    dm = _EXECUTORS["tsp_distance_matrix"]({}, points=points)["dist_matrix"]
+    assert dm.dtype == np.float32
+    assert np.allclose(dm, expected)
+    assert (dm == dm.T).all()
+    assert (np.diag(dm) == 0).all()
+    int_dm = _EXECUTORS["tsp_distance_matrix"]({}, points=np.array([[0, 0], [3, 4]]))
+    assert int_dm["dist_matrix"][0, 1] == 5.0
 
 
 def test_greedy_executor():
@@ -68,6 +96,48 @@ def test_greedy_executor():
     assert len(result["tour"]) == 3
 
 
+def test_two_opt_executor_uncrosses_tour():
+    import numpy as np
+    _fresh_load()
+    # Unit square visited 0-2-1-3: the two diagonals cross
+    points = np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=float)
+    dm = np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1)).astype(np.float32)
+    tour = np.array([0, 2, 1, 3])
+    result = _EXECUTORS["tsp_2opt"]({}, dist_matrix=dm, tour=tour)
+    assert sorted(result["tour"].tolist()) == [0, 1, 2, 3]
+    assert abs(result["tour_length"] - 4.0) < 1e-6
+    assert abs(result["improvement"] - (2 * np.sqrt(2) - 2)) < 1e-6
+    assert tour.tolist() == [0, 2, 1, 3]  # input left untouched
+
+
+def test_two_opt_reported_length_matches_tour():
+    import numpy as np
+    _fresh_load()
+    points = np.random.default_rng(7).uniform(0, 1000, size=(120, 2))
+    dm = np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1)).astype(np.float32)
+    result = _EXECUTORS["tsp_2opt"]({"max_iterations": 1000}, dist_matrix=dm, tour=np.arange(120))
+    tour = result["tour"]
+    assert sorted(tour.tolist()) == list(range(120))
+    actual = dm[tour, np.roll(tour, -1)].sum(dtype=np.float64)
+    assert abs(result["tour_length"] - actual) < 1e-3
+    assert result["improvement"] > 0
+
+
+def test_two_opt_improves_subtour():
+    """A tour over only some cities of the matrix is improved, not crashed on."""
+    import numpy as np
+    _fresh_load()
+    points = np.random.default_rng(3).uniform(0, 1000, size=(40, 2))
+    dm = np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1)).astype(np.float32)
+    stops = np.array([5, 31, 2, 17, 9, 26, 38, 12])
+    result = _EXECUTORS["tsp_2opt"]({}, dist_matrix=dm, tour=stops)
+    tour = result["tour"]
+    assert sorted(tour.tolist()) == sorted(stops.tolist())
+    actual = dm[tour, np.roll(tour, -1)].sum(dtype=np.float64)
+    assert abs(result["tour_length"] - actual) < 1e-3
+    assert result["improvement"] >= 0
+
+
 def test_evaluate_executor():
     import numpy as np
     _fresh_load()
@@ -78,6 +148,18 @@ def test_evaluate_executor():
     assert result["tour_length"] > 0
 
 
+def test_tour_length_agrees_across_nodes():
+    import numpy as np
+    _fresh_load()
+    points = np.array([[0, 0], [3, 0], [3, 4]], dtype=np.float32)
+    dm = np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1)).astype(np.float32)
+    tour = np.array([0, 1, 2])
+    logged = _EXECUTORS["tsp_log_tour"]({}, tour=tour, dist_matrix=dm)
+    mapped = _EXECUTORS["tsp_map_visualize"]({}, points=points, tour=tour)
+    assert logged["tour_length"] == 12.0
+    assert mapped["tour_length"] == 12.0
+
+
 def test_node_spec_has_required_fields():
     _fresh_load()
     for node_type, spec in _NODE_REGISTRY.items():
@@ -75,3 +75,85 @@ def test_duplicate_node_type_warns():
         })
         assert len(w) == 1
         assert "test_dup" in str(w[0].message)
+
+
+def test_identical_reregistration_is_silent():
+    """Registering an identical NODE_INFO again keeps the spec and does not warn."""
+    info = {"type": "test_same", "ports_in": [{"name": "x"}], "ports_out": []}
+    register_node(info)
+    spec = _NODE_REGISTRY["test_same"]
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        register_node(dict(info), lambda params: {})
+        assert len(w) == 0
+    assert _NODE_REGISTRY["test_same"] is spec
+    assert "test_same" in _EXECUTORS
+
+
+def test_reregistration_with_array_default_is_treated_as_changed():
+    """NODE_INFOs whose == is ambiguous (numpy defaults) re-register with a warning."""
+    import numpy as np
+    info = {"type": "test_arr_default",
+            "ports_in": [{"name": "x", "default": np.zeros(3)}], "ports_out": []}
+    register_node(info)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        register_node({**info, "ports_in": [{"name": "x", "default": np.zeros(3)}]})
+        assert len(w) == 1
+    assert "test_arr_default" in _NODE_REGISTRY
+
+
+# --- Registration capture (plugin loader ownership) ---
+
+def test_capture_registrations_collects_types_in_block():
+    """Node types registered inside _capture_registrations are reported, outside ones are not."""
+    from pipestudio.plugin_api import _capture_registrations
+    register_node({"type": "test_cap_outside", "ports_in": [], "ports_out": []})
+    with _capture_registrations() as captured:
+        register_node({"type": "test_cap_a", "ports_in": [], "ports_out": []})
+        register_node({"type": "test_cap_b", "ports_in": [], "ports_out": []})
+    register_node({"type": "test_cap_after", "ports_in": [], "ports_out": []})
+    assert captured == ["test_cap_a", "test_cap_b"]
+
+
+def test_capture_registrations_staged_defers_registration():
+    """With a staging list, register_node records the call instead of registering."""
+    from pipestudio.plugin_api import _capture_registrations
+    staged = []
+    info = {"type": "test_cap_staged", "ports_in": [], "ports_out": []}
+    with _capture_registrations(staged) as captured:
+        register_node(info)
+    assert captured == ["test_cap_staged"]
+    assert "test_cap_staged" not in _NODE_REGISTRY
+    assert staged == [(info, None)]
+
+
+def test_registry_view_is_live_and_read_only():
+    """get_registry_view reflects new registrations and rejects writes."""
+    from pipestudio.plugin_api import get_registry_view, get_node_spec
+    view = get_registry_view()
+    register_node({"type": "test_view_node", "ports_in": [], "ports_out": []})
+    assert view["test_view_node"] is get_node_spec("test_view_node")
+    assert get_node_spec("test_view_missing") is None
+    with pytest.raises(TypeError):
+        view["test_view_other"] = {}
+
+
+def test_registry_version_tracks_changes():
+    """The registry version moves on new specs and removals, not on identical re-registration."""
+    from pipestudio.plugin_api import get_registry_version
+
+    info = {"type": "test_version", "ports_in": [], "ports_out": []}
+    start = get_registry_version()
+    register_node(info)
+    registered = get_registry_version()
+    assert registered != start
+
+    register_node(info)
+    assert get_registry_version() == registered
+
+    unregister_node("test_version")
+    assert get_registry_version() != registered
+    removed = get_registry_version()
+    unregister_node("test_version")
+    assert get_registry_version() == removed
@@ -57,6 +57,37 @@ def test_zip_slip_dot_dot_path_rejected(client):
     assert resp.status_code == 400
 
 
+def test_zip_slip_manifest_name_rejected(client):
+    """A manifest name that escapes the plugins directory must be rejected."""
+    for name in ("../evil", "/tmp/evil", "."):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("test_plugin/manifest.json", json.dumps({"name": name}))
+            zf.writestr("test_plugin/nodes/x.py", "import os")
+        buf.seek(0)
+        resp = client.post(
+            "/api/plugins/install",
+            files={"file": ("evil.zip", buf, "application/zip")},
+        )
+        assert resp.status_code == 400, name
+        assert "unsafe" in resp.json()["detail"].lower()
+
+
+def test_invalid_manifest_rejected(client):
+    """Malformed manifests are a 400, not a server error."""
+    for manifest in (b"{not json", b"\xff\xfe", b"[1, 2]", b'{"name": 42}'):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("test_plugin/manifest.json", manifest)
+        buf.seek(0)
+        resp = client.post(
+            "/api/plugins/install",
+            files={"file": ("bad.zip", buf, "application/zip")},
+        )
+        assert resp.status_code == 400, manifest
+        assert resp.json()["detail"] == "Invalid manifest.json"
+
+
 # --- B4: Path traversal in load_example ---
 
 def test_path_traversal_url_encoded_rejected(client):
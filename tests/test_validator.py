@@ -55,6 +55,25 @@ def test_missing_required_input_connection():
     assert any("dist_matrix" in i["message"] and i["node_id"] == "n1" for i in errors)
 
 
+def test_required_ports_follow_re_registration():
+    """Cached required ports are recomputed when a node type's spec is replaced."""
+    import warnings
+    from pipestudio.plugin_api import register_node, unregister_node
+    _load()
+    wf = _wf(nodes=[_node("n1", "test_req_cache")])
+    try:
+        register_node({"type": "test_req_cache", "ports_in": [{"name": "x"}], "ports_out": []})
+        assert any("'x'" in i["message"] for i in validate_workflow(wf))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            register_node({"type": "test_req_cache",
+                           "ports_in": [{"name": "x", "default": 1}], "ports_out": []})
+        assert not any("'x'" in i["message"] for i in validate_workflow(wf))
+    finally:
+        unregister_node("test_req_cache")
+
+
 def test_disconnected_isolated_node_warning():
     _load()
     wf = _wf(
@@ -92,6 +111,16 @@ def test_cycle_detection_error():
     assert any("cycle" in i["message"].lower() for i in errors)
 
 
+def test_cycle_detection_deep_chain_no_recursion_limit():
+    """A chain deeper than the recursion limit is handled; closing it is a cycle."""
+    from pipestudio.validator import _has_cycle
+    n = sys.getrecursionlimit() + 500
+    adjacency = [[i + 1] for i in range(n - 1)] + [[]]
+    assert not _has_cycle(adjacency)
+    adjacency[-1] = [0]
+    assert _has_cycle(adjacency)
+
+
 def test_unknown_node_type_error():
     _load()
     wf = _wf(nodes=[_node("n1", "totally_fake_node")])
@@ -350,3 +379,22 @@ def test_loop_types_not_flagged_as_isolated():
     assert "ls" not in isolated_ids
     assert "le" not in isolated_ids
     assert "ln" not in isolated_ids
+
+
+def test_results_are_memoized_and_copied():
+    """Unchanged workflows hit the cache; callers cannot corrupt cached issues."""
+    from pipestudio import validator
+    _load()
+    wf = _wf(nodes=[_node("n1", "tsp_greedy")])
+    first = validate_workflow(wf)
+    first[0]["message"] = "mutated"
+    first.append({"level": "error", "node_id": None, "message": "extra"})
+
+    second = validate_workflow(_wf(nodes=[_node("n1", "tsp_greedy")]))
+    assert second != first
+    assert all(i["message"] != "mutated" for i in second)
+    assert len(validator._RESULT_CACHE) <= validator._RESULT_CACHE_SIZE
+
+    # A registry change invalidates the cached result
+    _NODE_REGISTRY.clear()
+    assert any("Unknown node type" in i["message"] for i in validate_workflow(wf))
@@ -44,6 +44,19 @@ def test_nodes_endpoint(client):
     assert data["tsp_generate_points"]["category"] == "INPUT"
 
 
+def test_nodes_endpoint_tracks_direct_registration(client):
+    """register_node/unregister_node outside the plugin endpoints refresh /nodes."""
+    from pipestudio.plugin_api import register_node, unregister_node
+
+    assert "test_direct_node" not in client.get("/api/workflow/nodes").json()
+    register_node({"type": "test_direct_node", "ports_in": [], "ports_out": []})
+    try:
+        assert "test_direct_node" in client.get("/api/workflow/nodes").json()
+    finally:
+        unregister_node("test_direct_node")
+    assert "test_direct_node" not in client.get("/api/workflow/nodes").json()
+
+
 def test_execute_simple_workflow(client):
     """Execute a simple generate -> distance_matrix workflow via REST."""
     payload = {
@@ -65,6 +78,25 @@ def test_execute_simple_workflow(client):
     assert "dist_matrix" in data["dm"]
 
 
+def test_execute_rejects_malformed_nodes(client):
+    """Nodes are validated during request binding: a node without an id is a 422."""
+    resp = client.post("/api/workflow/execute",
+                       json={"nodes": [{"type": "tsp_generate_points"}], "edges": []})
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["loc"] == ["body", "nodes", 0, "id"]
+
+
+def test_malformed_execute_request_broadcasts_error(client):
+    """A request rejected during binding still reaches WebSocket clients as an error event."""
+    with client.websocket_connect("/ws/execution") as ws:
+        resp = client.post("/api/workflow/execute",
+                           json={"nodes": [{"type": "tsp_generate_points"}], "edges": []})
+        assert resp.status_code == 422
+        frame = ws.receive_json()
+    assert frame["event"] == "error"
+    assert "nodes" in frame["message"]
+
+
 def test_websocket_connects_and_disconnects(client):
     """WebSocket endpoint accepts connections and handles disconnect."""
     with client.websocket_connect("/ws/execution") as ws:
@@ -135,6 +167,179 @@ def test_execution_events_include_duration():
     assert complete_events[0]["duration_ms"] >= 0
 
 
+def test_events_have_increasing_seq():
+    """Every emitted event carries a strictly increasing seq number."""
+    from pipestudio.models import WorkflowNode, WorkflowDefinition
+    from pipestudio.executor import WorkflowExecutor
+
+    events = []
+    def handler(event_type, data):
+        events.append({"event": event_type, **data})
+
+    wf = WorkflowDefinition(
+        name="test",
+        nodes=[WorkflowNode(id="gen", type="tsp_generate_points", params={"num_points": 10})],
+        edges=[],
+    )
+    WorkflowExecutor(wf, event_handler=handler).execute()
+
+    seqs = [e["seq"] for e in events]
+    assert seqs == list(range(1, len(events) + 1))
+
+
+def test_broadcast_drops_failing_clients():
+    """broadcast reaches every live client and prunes ones whose send fails."""
+    import asyncio
+    from pipestudio.server import ConnectionManager
+
+    class FakeSocket:
+        def __init__(self, fail=False):
+            self.fail = fail
+            self.sent = []
+
+        async def send_text(self, text):
+            if self.fail:
+                raise RuntimeError("closed")
+            self.sent.append(text)
+
+    good, bad = FakeSocket(), FakeSocket(fail=True)
+    manager = ConnectionManager()
+    manager.connections = {good, bad}
+    asyncio.run(manager.broadcast({"event": "start", "seq": 1}))
+
+    assert good.sent == ['{"event":"start","seq":1}']
+    assert manager.connections == {good}
+
+
+def test_execution_events_arrive_in_batch_frames(client):
+    """A REST execution reaches WebSocket clients as chunked "batch" frames."""
+    from pipestudio import server
+
+    payload = {
+        "name": "test",
+        "nodes": [
+            {"id": "gen", "type": "tsp_generate_points", "params": {"num_points": 10}},
+            {"id": "dm", "type": "tsp_distance_matrix"},
+        ],
+        "edges": [
+            {"id": "e1", "source": "gen", "source_port": "points",
+             "target": "dm", "target_port": "points"},
+        ],
+    }
+    original = server.WS_BATCH_SIZE
+    server.WS_BATCH_SIZE = 3
+    try:
+        with client.websocket_connect("/ws/execution") as ws:
+            assert client.post("/api/workflow/execute", json=payload).status_code == 200
+            items = []
+            while not items or items[-1]["event"] != "complete":
+                frame = ws.receive_json()
+                assert frame["event"] == "batch"
+                assert 0 < len(frame["items"]) <= 3
+                items.extend(frame["items"])
+    finally:
+        server.WS_BATCH_SIZE = original
+
+    assert items[0]["event"] == "start"
+    assert [e["seq"] for e in items] == sorted(e["seq"] for e in items)
+
+
+def test_execution_events_broadcast_before_response(client, monkeypatch):
+    """Event frames go out before the HTTP result, so they never overwrite it."""
+    from pipestudio import server
+
+    order = []
+    broadcast = server.ws_manager.broadcast
+    serialize_outputs = server.serialize_outputs
+
+    async def recording_broadcast(message):
+        order.append("ws")
+        await broadcast(message)
+
+    def recording_serialize(raw):
+        order.append("response")
+        return serialize_outputs(raw)
+
+    monkeypatch.setattr(server.ws_manager, "broadcast", recording_broadcast)
+    monkeypatch.setattr(server, "serialize_outputs", recording_serialize)
+    payload = {
+        "name": "test",
+        "nodes": [{"id": "gen", "type": "tsp_generate_points", "params": {"num_points": 5}}],
+        "edges": [],
+    }
+    assert client.post("/api/workflow/execute", json=payload).status_code == 200
+    assert order[-1] == "response"
+    assert "ws" in order
+
+
+def test_install_plugin_extracts_in_background(client, tmp_path, monkeypatch):
+    """Install answers 202, then extracts, reloads and announces over the WebSocket."""
+    import io
+    import json
+    import zipfile
+    from pipestudio import server
+
+    reloaded = []
+    monkeypatch.setattr(server, "ABS_PLUGINS_DIR", str(tmp_path))
+    monkeypatch.setattr(server, "_reload_project", lambda *args: reloaded.append(args))
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("demo/manifest.json", json.dumps({"name": "demo"}))
+        zf.writestr("demo/nodes/node.py", "NODE_INFO = {}")
+    buf.seek(0)
+
+    with client.websocket_connect("/ws/execution") as ws:
+        resp = client.post(
+            "/api/plugins/install",
+            files={"file": ("demo.zip", buf, "application/zip")},
+        )
+        assert resp.status_code == 202
+        assert resp.json()["status"] == "installing"
+        assert ws.receive_json() == {"event": "plugin_installed", "name": "demo"}
+
+    assert (tmp_path / "demo" / "nodes" / "node.py").read_text() == "NODE_INFO = {}"
+    assert reloaded == [(os.path.abspath(str(tmp_path)), "demo")]
+
+
+def test_event_buffer_drops_logs_with_lagged_notice():
+    """A full EventBuffer drops log events and reports the gap once."""
+    from pipestudio.server import EventBuffer
+
+    buf = EventBuffer(maxlen=2)
+    buf("start", {"seq": 1})
+    buf("log", {"seq": 2, "message": "kept"})
+    buf("log", {"seq": 3, "message": "dropped"})
+    buf("log_batch", {"seq": 4, "entries": []})
+    buf("complete", {"seq": 5})
+
+    assert [e["event"] for e in buf.events] == ["start", "log", "lagged", "complete"]
+    lagged = buf.events[2]
+    assert lagged["dropped"] == 2
+    assert lagged["last_seq"] == 4
+
+
+def test_serialize_outputs_summarizes_large_arrays():
+    """Arrays over 100 elements are summarized; sorted_ratio counts ascending steps."""
+    import numpy as np
+    from pipestudio.server import serialize_outputs
+
+    arr = np.arange(200, dtype=float)
+    arr[[50, 150]] = -1.0  # each dip is one descending step
+    out = serialize_outputs({"n": {"big": arr, "small": np.arange(3)}})
+    big = out["n"]["big"]
+    assert big["_type"] == "array"
+    assert big["length"] == 200
+    assert big["min"] == -1.0 and big["max"] == 199.0
+    assert big["sorted_ratio"] == 1.0 - 2 / 199
+    assert big["last_10"].tolist() == list(range(190, 200))  # left for orjson
+    assert isinstance(out["n"]["small"], np.ndarray)  # left for orjson
+
+    pts = serialize_outputs({"n": {"pts": np.zeros((150, 2))}})["n"]["pts"]
+    assert pts["length"] == 150
+    assert pts["sorted_ratio"] == 1.0
+
+
 def test_examples_endpoint(client):
     """Examples endpoint lists available example workflows."""
     resp = client.get("/api/workflow/examples")